@@ -3,18 +3,34 @@ from importlib.metadata import version
 
 __version__ = version("ring_doorbell")
 
-from ring_doorbell.ring import Ring
-from ring_doorbell.auth import Auth
+from ring_doorbell.ring import Ring, AsyncRing
+from ring_doorbell.auth import Auth, AsyncAuth, create_adapter
 from ring_doorbell.chime import RingChime
 from ring_doorbell.stickup_cam import RingStickUpCam
 from ring_doorbell.group import RingLightGroup
 from ring_doorbell.doorbot import RingDoorBell
+from ring_doorbell.event import HistoryEvent
+from ring_doorbell.event_store import RingEventStore
+from ring_doorbell.changes import DeviceChange
+from ring_doorbell.poller import RingPoller
+from ring_doorbell.listen import RingEventListener, JsonLinesTransport
+from ring_doorbell.cache import ResponseCache
 
 __all__ = [
     "Ring",
+    "AsyncRing",
     "Auth",
+    "AsyncAuth",
+    "create_adapter",
     "RingChime",
     "RingStickUpCam",
     "RingLightGroup",
     "RingDoorBell",
+    "RingEventStore",
+    "HistoryEvent",
+    "DeviceChange",
+    "RingPoller",
+    "RingEventListener",
+    "JsonLinesTransport",
+    "ResponseCache",
 ]
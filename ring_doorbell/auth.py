@@ -1,20 +1,109 @@
 # coding: utf-8
 # vim:sw=4:ts=4:et:
 """Python Ring Auth Class."""
+import asyncio
+import logging
+import socket
+import threading
+import time
 from uuid import uuid4 as uuid
 from json import dumps as json_dumps
+import aiohttp
+from requests.adapters import DEFAULT_POOLSIZE, HTTPAdapter
 from requests_oauthlib import OAuth2Session
 from oauthlib.oauth2 import LegacyApplicationClient, TokenExpiredError
-from ring_doorbell.const import OAuth, API_VERSION, TIMEOUT
+from urllib3.connection import HTTPConnection
+from urllib3.util.retry import Retry
+from ring_doorbell.const import (
+    OAuth,
+    API_VERSION,
+    DEFAULT_POOL_MAXSIZE,
+    DEFAULT_RETRY_BACKOFF,
+    DEFAULT_TOKEN_REFRESH_MARGIN,
+    RETRY_STATUSES,
+    TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# methods retried by AsyncAuth, the ones urllib3 retries by default
+_IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "PUT", "DELETE", "TRACE"})
+
+
+def create_adapter(
+    pool_maxsize=DEFAULT_POOL_MAXSIZE,
+    pool_connections=DEFAULT_POOLSIZE,
+    retries=0,
+    keepalive=True,
+):
+    """Return a requests adapter with a sized connection pool.
+
+    The adapter can be passed to several :class:`Auth` objects so they
+    reuse the same warm connections.
+
+    :param pool_maxsize: connections kept open per host, size it to the
+        number of concurrent requests, e.g. max_workers of Ring
+    :param pool_connections: number of hosts pools are kept for
+    :param retries: times idempotent requests are retried after connection
+        errors or a 502/503/504 response, with exponential backoff
+    :param keepalive: enable TCP keep-alive probes on idle connections
+    """
+    if retries:
+        retry = Retry(
+            total=retries,
+            backoff_factor=DEFAULT_RETRY_BACKOFF,
+            status_forcelist=RETRY_STATUSES,
+            raise_on_status=False,
+        )
+    else:
+        # the requests default, read timeouts raise ReadTimeout
+        retry = Retry(0, read=False)
+    return _PoolAdapter(
+        keepalive=keepalive,
+        pool_connections=pool_connections,
+        pool_maxsize=pool_maxsize,
+        max_retries=retry,
+    )
+
+
+class _PoolAdapter(HTTPAdapter):
+    """HTTPAdapter optionally enabling TCP keep-alive."""
+
+    __attrs__ = HTTPAdapter.__attrs__ + ["_keepalive"]
+
+    def __init__(self, keepalive=True, **kwargs):
+        self._keepalive = keepalive
+        super().__init__(**kwargs)
+
+    def init_poolmanager(self, *args, **kwargs):
+        if self._keepalive:
+            kwargs["socket_options"] = HTTPConnection.default_socket_options + [
+                (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1)
+            ]
+        super().init_poolmanager(*args, **kwargs)
 
 
 class Auth:
     """A Python Auth class for Ring"""
 
-    def __init__(self, user_agent, token=None, token_updater=None, hardware_id=None):
+    def __init__(
+        self,
+        user_agent,
+        token=None,
+        token_updater=None,
+        hardware_id=None,
+        auto_refresh=False,
+        refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+        adapter=None,
+    ):
         """
         :type token: Optional[Dict[str, str]]
         :type token_updater: Optional[Callable[[str], None]]
+        :param auto_refresh: refresh the token from a background timer
+            refresh_margin seconds before it expires
+        :param adapter: requests adapter used for all requests, see
+            :func:`create_adapter`; a pool of DEFAULT_POOL_MAXSIZE
+            connections by default
         """
         self.user_agent = user_agent
 
@@ -26,6 +115,51 @@ class Auth:
         self._oauth = OAuth2Session(
             client=LegacyApplicationClient(client_id=OAuth.CLIENT_ID), token=token
         )
+        self.adapter = adapter if adapter is not None else create_adapter()
+        self._oauth.mount("https://", self.adapter)
+        self._refresh_lock = threading.RLock()
+        self.auto_refresh = auto_refresh
+        self.refresh_margin = refresh_margin
+        self._refresh_timer = None
+        self._schedule_refresh()
+
+    @property
+    def expires_at(self):
+        """Return the expiry of the access token as an epoch timestamp."""
+        return (self._oauth.token or {}).get("expires_at")
+
+    def close(self):
+        """Stop the background token refresh."""
+        self.auto_refresh = False
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+
+    def _schedule_refresh(self):
+        """Start a timer refreshing the current token ahead of its expiry."""
+        if not self.auto_refresh:
+            return
+        with self._refresh_lock:
+            if self._refresh_timer is not None:
+                self._refresh_timer.cancel()
+                self._refresh_timer = None
+            expires_at = self.expires_at
+            if expires_at is None:
+                return
+            delay = max(expires_at - self.refresh_margin - time.time(), 0)
+            self._refresh_timer = threading.Timer(
+                delay, self._refresh_ahead, args=(self._oauth.token,)
+            )
+            self._refresh_timer.daemon = True
+            self._refresh_timer.start()
+
+    def _refresh_ahead(self, token):
+        try:
+            self._refresh_expired(token)
+        except Exception as err:  # pylint: disable=broad-except
+            # the token is refreshed on demand once expired
+            _LOGGER.warning("Background token refresh failed: %s", err)
 
     def fetch_token(self, username, password, otp_code=None):
         """Initial token fetch with username/password & 2FA
@@ -50,25 +184,45 @@ class Auth:
         if self.token_updater is not None:
             self.token_updater(token)
 
+        self._schedule_refresh()
         return token
 
     def refresh_tokens(self):
         """Refreshes the auth tokens"""
-        token = self._oauth.refresh_token(
-            OAuth.ENDPOINT, headers={"User-Agent": self.user_agent}
-        )
+        with self._refresh_lock:
+            token = self._oauth.refresh_token(
+                OAuth.ENDPOINT, headers={"User-Agent": self.user_agent}
+            )
 
-        if self.token_updater is not None:
-            self.token_updater(token)
+            if self.token_updater is not None:
+                self.token_updater(token)
 
-        return token
+            self._schedule_refresh()
+            return token
+
+    def _refresh_expired(self, token):
+        """Refresh the expired token unless another thread replaced it.
+
+        Threads hitting the expiry together wait for a single refresh.
+        """
+        with self._refresh_lock:
+            if self._oauth.token is token:
+                self._oauth.token = self.refresh_tokens()
 
     def get_hardware_id(self):
         """Get hardware ID."""
         return self.hardware_id
 
     def query(
-        self, url, method="GET", extra_params=None, data=None, json=None, timeout=None
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
     ):
         """Query data from Ring API."""
         if timeout is None:
@@ -79,10 +233,15 @@ class Auth:
         if extra_params:
             params.update(extra_params)
 
+        headers = {"User-Agent": self.user_agent}
+        if extra_headers:
+            headers.update(extra_headers)
+
         kwargs = {
             "params": params,
-            "headers": {"User-Agent": self.user_agent},
+            "headers": headers,
             "timeout": timeout,
+            "stream": stream,
         }
 
         if method == "POST":
@@ -98,12 +257,300 @@ class Auth:
             if data is not None:
                 kwargs["data"] = data
 
+        token = self._oauth.token
         try:
             req = getattr(self._oauth, method.lower())(url, **kwargs)
         except TokenExpiredError:
-            self._oauth.token = self.refresh_tokens()
+            self._refresh_expired(token)
             req = getattr(self._oauth, method.lower())(url, **kwargs)
 
         req.raise_for_status()
 
         return req
+
+
+class AsyncAuth:
+    """An asyncio Auth class for Ring backed by aiohttp.
+
+    Token handling is delegated to oauthlib exactly as in :class:`Auth`,
+    only the transport differs.
+    """
+
+    def __init__(
+        self,
+        user_agent,
+        token=None,
+        token_updater=None,
+        hardware_id=None,
+        session=None,
+        auto_refresh=False,
+        refresh_margin=DEFAULT_TOKEN_REFRESH_MARGIN,
+        pool_maxsize=DEFAULT_POOL_MAXSIZE,
+        keepalive_timeout=None,
+        retries=0,
+    ):
+        """
+        :type token: Optional[Dict[str, str]]
+        :type token_updater: Optional[Callable[[str], None]]
+        :type session: Optional[aiohttp.ClientSession]
+        :param auto_refresh: refresh the token from a background task
+            refresh_margin seconds before it expires
+        :param pool_maxsize: connections per host of the session created
+            when none is passed, share a session to share its pool
+        :param keepalive_timeout: seconds idle connections are kept open,
+            aiohttp's default when None
+        :param retries: times idempotent requests are retried after
+            connection errors or a 502/503/504 response
+        """
+        self.user_agent = user_agent
+
+        self.hardware_id = hardware_id
+        if self.hardware_id is None:
+            self.hardware_id = str(uuid())
+
+        self.token_updater = token_updater
+        self._client = LegacyApplicationClient(client_id=OAuth.CLIENT_ID, token=token)
+        self._session = session
+        self._close_session = session is None
+        self.pool_maxsize = pool_maxsize
+        self.keepalive_timeout = keepalive_timeout
+        self.retries = retries
+        self._refresh_lock = None
+        self.auto_refresh = auto_refresh
+        self.refresh_margin = refresh_margin
+        self._refresh_task = None
+
+    @property
+    def token(self):
+        """Return the current token."""
+        return self._client.token
+
+    @property
+    def expires_at(self):
+        """Return the expiry of the access token as an epoch timestamp."""
+        return (self._client.token or {}).get("expires_at")
+
+    def _schedule_refresh(self):
+        """Start a task refreshing the current token ahead of its expiry."""
+        if not self.auto_refresh:
+            return
+        task = self._refresh_task
+        # the refresh task schedules its successor
+        if task is not None and task is not asyncio.current_task():
+            task.cancel()
+        self._refresh_task = None
+        if self.expires_at is None:
+            return
+        delay = max(self.expires_at - self.refresh_margin - time.time(), 0)
+        self._refresh_task = asyncio.ensure_future(
+            self._refresh_ahead(self._client.token, delay)
+        )
+
+    async def _refresh_ahead(self, token, delay):
+        await asyncio.sleep(delay)
+        try:
+            await self._refresh_expired(token)
+        except Exception as err:  # pylint: disable=broad-except
+            # the token is refreshed on demand once expired
+            _LOGGER.warning("Background token refresh failed: %s", err)
+
+    def _get_session(self):
+        if self._session is None:
+            kwargs = {"limit_per_host": self.pool_maxsize}
+            if self.keepalive_timeout is not None:
+                kwargs["keepalive_timeout"] = self.keepalive_timeout
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(**kwargs)
+            )
+        return self._session
+
+    async def close(self):
+        """Stop the background token refresh and close the aiohttp session.
+
+        The session is only closed if it was created here.
+        """
+        self.auto_refresh = False
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            self._refresh_task = None
+        if self._session is not None and self._close_session:
+            await self._session.close()
+            self._session = None
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        await self.close()
+
+    async def _request_token(self, body, headers):
+        headers = {
+            **headers,
+            "Accept": "application/json",
+            "Content-Type": "application/x-www-form-urlencoded;charset=UTF-8",
+        }
+        async with self._get_session().post(
+            OAuth.ENDPOINT,
+            data=body,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=TIMEOUT),
+        ) as resp:
+            text = await resp.text()
+
+        # raises the same oauthlib errors as the sync client,
+        # i.e. MissingTokenError when 2FA is required
+        return self._client.parse_request_body_response(text, scope=OAuth.SCOPE)
+
+    async def fetch_token(self, username, password, otp_code=None):
+        """Initial token fetch with username/password & 2FA
+        :type username: str
+        :type password: str
+        :type otp_code: str
+        """
+        headers = {"User-Agent": self.user_agent, "hardware_id": self.hardware_id}
+
+        if otp_code:
+            headers["2fa-support"] = "true"
+            headers["2fa-code"] = otp_code
+
+        body = self._client.prepare_request_body(
+            username=username,
+            password=password,
+            scope=OAuth.SCOPE,
+            include_client_id=True,
+        )
+        token = await self._request_token(body, headers)
+
+        if self.token_updater is not None:
+            self.token_updater(token)
+
+        self._schedule_refresh()
+        return token
+
+    def _get_refresh_lock(self):
+        # created lazily so it belongs to the running event loop
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+        return self._refresh_lock
+
+    async def refresh_tokens(self):
+        """Refreshes the auth tokens"""
+        async with self._get_refresh_lock():
+            return await self._refresh_tokens()
+
+    async def _refresh_expired(self, token):
+        """Refresh the expired token unless another task replaced it.
+
+        Tasks hitting the expiry together wait for a single refresh.
+        """
+        async with self._get_refresh_lock():
+            if self._client.token is token:
+                await self._refresh_tokens()
+
+    async def _refresh_tokens(self):
+        refresh_token = self._client.refresh_token
+        body = self._client.prepare_refresh_body(
+            refresh_token=refresh_token, client_id=OAuth.CLIENT_ID
+        )
+        token = await self._request_token(body, {"User-Agent": self.user_agent})
+        if "refresh_token" not in token:
+            token["refresh_token"] = refresh_token
+            self._client.refresh_token = refresh_token
+
+        if self.token_updater is not None:
+            self.token_updater(token)
+
+        self._schedule_refresh()
+        return token
+
+    def get_hardware_id(self):
+        """Get hardware ID."""
+        return self.hardware_id
+
+    async def _request(self, method, url, headers, kwargs):
+        """Send a request, retrying idempotent ones on transient failures."""
+        retries = self.retries if method in _IDEMPOTENT_METHODS else 0
+        for attempt in range(retries + 1):
+            last = attempt == retries
+            try:
+                resp = await self._get_session().request(
+                    method, url, headers=headers, **kwargs
+                )
+            except aiohttp.ClientConnectionError:
+                if last:
+                    raise
+            else:
+                if last or resp.status not in RETRY_STATUSES:
+                    return resp
+                resp.release()
+            await asyncio.sleep(DEFAULT_RETRY_BACKOFF * 2**attempt)
+
+    async def query(
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
+    ):
+        """Query data from Ring API.
+
+        Unless stream is True the body is read before returning so
+        ``await response.json()`` can be used after the connection has been
+        released.
+        """
+        if timeout is None:
+            timeout = TIMEOUT
+
+        params = {"api_version": API_VERSION}
+
+        if extra_params:
+            params.update(extra_params)
+
+        kwargs = {
+            "params": {key: str(value) for key, value in params.items()},
+            "timeout": aiohttp.ClientTimeout(total=timeout),
+        }
+
+        if method == "POST":
+            if json is not None:
+                kwargs["json"] = json
+            if data is not None:
+                kwargs["data"] = data
+
+        if method == "PATCH":
+            if json is not None:
+                kwargs["data"] = json_dumps(json)
+            if data is not None:
+                kwargs["data"] = data
+
+        headers = {"User-Agent": self.user_agent}
+        if extra_headers:
+            headers.update(extra_headers)
+
+        if self.auto_refresh and self._refresh_task is None:
+            # a token passed to the constructor is scheduled once a loop runs
+            self._schedule_refresh()
+
+        token = self._client.token
+        try:
+            url, headers, _ = self._client.add_token(
+                url, http_method=method, headers=headers
+            )
+        except TokenExpiredError:
+            await self._refresh_expired(token)
+            url, headers, _ = self._client.add_token(
+                url, http_method=method, headers=headers
+            )
+
+        resp = await self._request(method, url, headers, kwargs)
+        if not stream:
+            # reading the whole body hands the connection back to the pool
+            await resp.read()
+
+        resp.raise_for_status()
+
+        return resp
@@ -0,0 +1,125 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring GET response cache."""
+from collections import OrderedDict
+import re
+import threading
+import time
+
+from ring_doorbell.const import (
+    DEFAULT_CACHE_MAX_BYTES,
+    DEFAULT_CACHE_MAX_ENTRIES,
+    DEFAULT_CACHE_TTLS,
+)
+
+
+class ResponseCache:
+    """A least recently used cache of GET responses.
+
+    Only urls matching one of the endpoint templates of ttls are cached,
+    each for the number of seconds given for its template. The values
+    filled into a template, e.g. device or group ids, identify the entry;
+    a write request whose path contains one of them drops the entry.
+
+    Pass an instance to :class:`Ring` to enable it.
+    """
+
+    def __init__(
+        self,
+        ttls=None,
+        max_entries=DEFAULT_CACHE_MAX_ENTRIES,
+        max_bytes=DEFAULT_CACHE_MAX_BYTES,
+    ):
+        """Initialize the cache.
+
+        :param ttls: seconds to keep responses per endpoint template such as
+            ``HEALTH_CHIMES_ENDPOINT``, defaults to DEFAULT_CACHE_TTLS
+        :param max_bytes: maximum total size of the cached bodies
+        """
+        if ttls is None:
+            ttls = DEFAULT_CACHE_TTLS
+        self._templates = [
+            (_template_regex(template), ttl) for template, ttl in ttls.items()
+        ]
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()
+        self._size = 0
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def match(self, url):
+        """Return the ttl and template values of url, None if not cached."""
+        for regex, ttl in self._templates:
+            match = regex.match(url)
+            if match:
+                return ttl, frozenset(match.groups())
+        return None
+
+    def get(self, url, params=None):
+        """Return the cached response of a GET request or None."""
+        key = _key(url, params)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if entry.expires_at <= time.monotonic():
+                self._remove(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry.response
+
+    def set(self, url, params, response, size):
+        """Cache a response of size bytes if url is cached."""
+        matched = self.match(url)
+        if matched is None or size > self.max_bytes:
+            return
+        ttl, ids = matched
+        key = _key(url, params)
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = _Entry(response, size, ids, time.monotonic() + ttl)
+            self._size += size
+            while len(self._entries) > self.max_entries or self._size > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+
+    def invalidate(self, url):
+        """Drop the entries of the devices or groups a write url refers to."""
+        segments = set(url.split("?", 1)[0].split("/"))
+        with self._lock:
+            for key in [
+                key for key, entry in self._entries.items() if entry.ids & segments
+            ]:
+                self._remove(key)
+
+    def clear(self):
+        """Drop every entry."""
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def _remove(self, key):
+        self._size -= self._entries.pop(key).size
+
+
+class _Entry:
+    __slots__ = ("response", "size", "ids", "expires_at")
+
+    def __init__(self, response, size, ids, expires_at):
+        self.response = response
+        self.size = size
+        self.ids = ids
+        self.expires_at = expires_at
+
+
+def _template_regex(template):
+    """Return a regex matching the urls of an endpoint template."""
+    parts = re.split(r"\{\d+\}", template)
+    return re.compile("([^/]+)".join(re.escape(part) for part in parts) + "$")
+
+
+def _key(url, params):
+    return url, tuple(sorted((params or {}).items()))
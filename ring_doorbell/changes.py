@@ -0,0 +1,67 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring device change tracking."""
+from typing import NamedTuple
+
+ADDED = "added"
+REMOVED = "removed"
+CHANGED = "changed"
+
+
+class DeviceChange(NamedTuple):
+    """A change of one device between two device updates.
+
+    fields maps the dotted keys of the changed attributes, such as
+    ``alerts.connection``, to their old and new value. A key missing on
+    one side has the value None there. It is empty for added and removed
+    devices.
+    """
+
+    family: str
+    id: int
+    action: str
+    fields: dict
+
+
+def diff_devices(old, new):
+    """Return the changes between two devices_data snapshots."""
+    changes = []
+    old = old or {}
+    for family, devices in new.items():
+        old_devices = old.get(family, {})
+        for device_id, attrs in devices.items():
+            old_attrs = old_devices.get(device_id)
+            if old_attrs is None:
+                changes.append(DeviceChange(family, device_id, ADDED, {}))
+            elif old_attrs != attrs:
+                changes.append(
+                    DeviceChange(
+                        family, device_id, CHANGED, diff_attrs(old_attrs, attrs)
+                    )
+                )
+    for family, old_devices in old.items():
+        devices = new.get(family, {})
+        for device_id in old_devices:
+            if device_id not in devices:
+                changes.append(DeviceChange(family, device_id, REMOVED, {}))
+    return changes
+
+
+def diff_attrs(old, new):
+    """Return the dotted keys whose value differs as a dict of (old, new)."""
+    fields = {}
+    _diff_into(fields, "", old, new)
+    return fields
+
+
+def _diff_into(fields, prefix, old, new):
+    for key in old.keys() | new.keys():
+        old_value = old.get(key)
+        new_value = new.get(key)
+        if old_value == new_value:
+            continue
+        name = prefix + str(key)
+        if isinstance(old_value, dict) and isinstance(new_value, dict):
+            _diff_into(fields, name + ".", old_value, new_value)
+        else:
+            fields[name] = (old_value, new_value)
@@ -3,7 +3,7 @@
 """Python Ring Chime wrapper."""
 import logging
 
-from ring_doorbell.generic import RingGeneric
+from ring_doorbell.generic import RingGeneric, SettingsRequest
 from ring_doorbell.const import (
     CHIMES_ENDPOINT,
     CHIME_VOL_MIN,
@@ -13,8 +13,6 @@ from ring_doorbell.const import (
     TESTSOUND_CHIME_ENDPOINT,
     CHIME_TEST_SOUND_KINDS,
     KIND_DING,
-    CHIME_KINDS,
-    CHIME_PRO_KINDS,
     HEALTH_CHIMES_ENDPOINT,
 )
 
@@ -24,6 +22,8 @@ _LOGGER = logging.getLogger(__name__)
 class RingChime(RingGeneric):
     """Implementation for Ring Chime."""
 
+    _family_capabilities = frozenset(["volume"])
+
     @property
     def family(self):
         """Return Ring device family type."""
@@ -31,26 +31,14 @@ class RingChime(RingGeneric):
 
     def update_health_data(self):
         """Update health attrs."""
-        self._health_attrs = (
-            self._ring.query(HEALTH_CHIMES_ENDPOINT.format(self.id))
-            .json()
-            .get("device_health", {})
+        self._set_health_data(
+            self._ring.query(HEALTH_CHIMES_ENDPOINT.format(self.id)).json()
         )
 
-    @property
-    def model(self):
-        """Return Ring device model name."""
-        if self.kind in CHIME_KINDS:
-            return "Chime"
-        if self.kind in CHIME_PRO_KINDS:
-            return "Chime Pro"
-        return None
-
-    def has_capability(self, capability):
-        """Return if device has specific capability."""
-        if capability == "volume":
-            return True
-        return False
+    async def async_update_health_data(self):
+        """Update health attrs."""
+        response = await self._ring.query(HEALTH_CHIMES_ENDPOINT.format(self.id))
+        self._set_health_data(await response.json())
 
     @property
     def volume(self):
@@ -59,18 +47,34 @@ class RingChime(RingGeneric):
 
     @volume.setter
     def volume(self, value):
+        request = self._volume_request(value)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_volume(self, value):
+        """Set the chime volume."""
+        request = self._volume_request(value)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _volume_request(self, value):
         if not ((isinstance(value, int)) and (CHIME_VOL_MIN <= value <= CHIME_VOL_MAX)):
             _LOGGER.error("%s", MSG_VOL_OUTBOUND.format(CHIME_VOL_MIN, CHIME_VOL_MAX))
-            return False
+            return None
 
         params = {
             "chime[description]": self.name,
             "chime[settings][volume]": str(value),
         }
-        url = CHIMES_ENDPOINT.format(self.id)
-        self._ring.query(url, extra_params=params, method="PUT")
-        self._ring.update_devices()
-        return True
+        return SettingsRequest(
+            CHIMES_ENDPOINT.format(self.id),
+            extra_params=params,
+            attrs={"settings": {"volume": value}},
+        )
 
     @property
     def linked_tree(self):
@@ -78,6 +82,12 @@ class RingChime(RingGeneric):
         url = LINKED_CHIMES_ENDPOINT.format(self.id)
         return self._ring.query(url).json()
 
+    async def async_get_linked_tree(self):
+        """Return doorbell data linked to chime."""
+        url = LINKED_CHIMES_ENDPOINT.format(self.id)
+        response = await self._ring.query(url)
+        return await response.json()
+
     def test_sound(self, kind=KIND_DING):
         """Play chime to test sound."""
         if kind not in CHIME_TEST_SOUND_KINDS:
@@ -85,3 +95,11 @@ class RingChime(RingGeneric):
         url = TESTSOUND_CHIME_ENDPOINT.format(self.id)
         self._ring.query(url, method="POST", extra_params={"kind": kind})
         return True
+
+    async def async_test_sound(self, kind=KIND_DING):
+        """Play chime to test sound."""
+        if kind not in CHIME_TEST_SOUND_KINDS:
+            return False
+        url = TESTSOUND_CHIME_ENDPOINT.format(self.id)
+        await self._ring.query(url, method="POST", extra_params={"kind": kind})
+        return True
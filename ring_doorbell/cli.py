@@ -5,12 +5,21 @@ import json
 import getpass
 import asyncio
 import logging
+import time
+from itertools import islice
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path, PurePath
 from oauthlib.oauth2 import MissingTokenError, InvalidGrantError, InvalidClientError
 import asyncclick as click
 from ring_doorbell.auth import Auth
 from ring_doorbell.ring import Ring
-from ring_doorbell.const import USER_AGENT, CLI_TOKEN_FILE, PACKAGE_NAME
+from ring_doorbell.event_store import RingEventStore
+from ring_doorbell.const import (
+    USER_AGENT,
+    CLI_TOKEN_FILE,
+    PACKAGE_NAME,
+    HISTORY_PAGE_SIZE,
+)
 
 
 def _header():
@@ -275,8 +284,8 @@ async def show(ctx, ring: Ring, device_name):
     else:
         devices = ring.get_device_list()
 
+    ring.update_health(devices)
     for dev in devices:
-        dev.update_health_data()
         echo("Name:       %s" % dev.name)
         echo("Family:     %s" % dev.family)
         echo("ID:         %s" % dev.id)
@@ -447,31 +456,58 @@ async def history_command(ctx, ring: Ring, device_name, kind, limit, json_flag):
 @click.option(
     "--device-name",
     "-dn",
+    multiple=True,
+    required=False,
+    help="Name of the ring device, can be repeated. "
+    + "If ommited uses the first device returned",
+)
+@click.option(
+    "--index",
+    required=False,
     default=None,
+    type=click.Path(dir_okay=False),
+    help="SQLite file keeping a local index of events, "
+    + "only new events are fetched when counting",
+)
+@click.option(
+    "--workers",
     required=False,
-    help="Name of the ring device, if ommited uses the first device returned",
+    default=1,
+    type=click.IntRange(min=1),
+    help="Number of videos to download in parallel",
 )
 @pass_ring
 @click.pass_context
 async def videos(
-    ctx, ring: Ring, count, download, download_all, max_count, download_to, device_name
+    ctx,
+    ring: Ring,
+    count,
+    download,
+    download_all,
+    max_count,
+    download_to,
+    device_name,
+    workers,
+    index,
 ):
     """Interact with ring videos."""
 
-    device = None
-    if device_name and not (device := ring.get_device_by_name(device_name)):
-        echo(
-            f"No device with name {device_name} found. "
-            + "List of found device names (kind) is:"
-        )
-        return await ctx.invoke(list_command)
-    if device and not device.has_capability("video"):
-        echo(f"Device {device.name} is not a video device")
-        return
+    devices = []
+    for name in device_name:
+        if not (device := ring.get_device_by_name(name)):
+            echo(
+                f"No device with name {name} found. "
+                + "List of found device names (kind) is:"
+            )
+            return await ctx.invoke(list_command)
+        if not device.has_capability("video"):
+            echo(f"Device {device.name} is not a video device")
+            return
+        devices.append(device)
     # return the first device is implemented to be consistent with previous cli version
-    if not device:
+    if not devices:
         if video_devices := ring.video_devices():
-            device = video_devices[0]
+            devices = [video_devices[0]]
         else:
             echo(
                 "No video devices found. "
@@ -480,7 +516,11 @@ async def videos(
             return await ctx.invoke(list_command)
 
     if not count and not download and not download_all:
-        echo("Last recording url is: " + device.recording_url(device.last_recording_id))
+        for device in devices:
+            echo(
+                "Last recording url is: "
+                + device.recording_url(device.last_recording_id)
+            )
         return
 
     events = None
@@ -489,32 +529,45 @@ async def videos(
         max_count = -1
 
     def _get_events(device, max_count):
-        limit = 100 if max_count == -1 else min(100, max_count)
-        events = []
-        history = device.history(limit=limit)
-        while len(history) > 0:
-            events += history
-            if (len(events) >= max_count and max_count != -1) or len(history) < limit:
-                break
-            history = device.history(older_than=history[-1]["id"], limit=limit)
-        return events
-
-    if count:
-        echo(
-            f"\tCounting videos linked on your Ring account for {device.name}.\n"
-            + "\tThis may take some time....\n"
-        )
+        if max_count == -1:
+            return list(device.iter_history())
+        events = device.iter_history(page_size=min(HISTORY_PAGE_SIZE, max_count))
+        return list(islice(events, max_count))
+
+    if count and index:
+        with RingEventStore(index) as store:
+            for device in devices:
+                echo(
+                    f"\tUpdating the index of {device.name} in {index}.\n"
+                    + "\tOnly new videos are fetched....\n"
+                )
+                store.sync(device)
+                kinds = store.count_by_kind(device)
+
+                echo("\tTotal videos: {}".format(sum(kinds.values())))
+                echo("\tDing triggered: {}".format(kinds.get("ding", 0)))
+                echo("\tMotion triggered: {}".format(kinds.get("motion", 0)))
+                echo("\tOn-Demand triggered: {}".format(kinds.get("on_demand", 0)))
+    elif count:
+        events = {}
+        for device in devices:
+            echo(
+                f"\tCounting videos linked on your Ring account for {device.name}.\n"
+                + "\tThis may take some time....\n"
+            )
 
-        events = _get_events(device, max_count)
+            events[device] = device_events = _get_events(device, max_count)
 
-        motion = len([m["kind"] for m in events if m["kind"] == "motion"])
-        ding = len([m["kind"] for m in events if m["kind"] == "ding"])
-        on_demand = len([m["kind"] for m in events if m["kind"] == "on_demand"])
+            motion = len([m["kind"] for m in device_events if m["kind"] == "motion"])
+            ding = len([m["kind"] for m in device_events if m["kind"] == "ding"])
+            on_demand = len(
+                [m["kind"] for m in device_events if m["kind"] == "on_demand"]
+            )
 
-        echo("\tTotal videos: {}".format(len(events)))
-        echo("\tDing triggered: {}".format(ding))
-        echo("\tMotion triggered: {}".format(motion))
-        echo("\tOn-Demand triggered: {}".format(on_demand))
+            echo("\tTotal videos: {}".format(len(device_events)))
+            echo("\tDing triggered: {}".format(ding))
+            echo("\tMotion triggered: {}".format(motion))
+            echo("\tOn-Demand triggered: {}".format(on_demand))
 
     if download:
         if events is None:
@@ -522,19 +575,80 @@ async def videos(
                 "\tGetting videos linked on your Ring account.\n"
                 + "\tThis may take some time....\n"
             )
-            events = _get_events(device, max_count)
+            events = {device: _get_events(device, max_count) for device in devices}
 
-        echo(
-            f"\tDownloading {len(events)} videos linked on your Ring account.\n"
-            + "\tThis may take some time....\n"
-        )
-        counter = 0
-        for event in events:
-            counter += 1
+        _download_videos(events, download_to, workers)
+
+
+def _download_videos(events, download_to, workers):
+    """Download the events of every device using a pool of workers."""
+    jobs = []
+    skipped = 0
+    for device, device_events in events.items():
+        for event in device_events:
             filename = str(PurePath(download_to, _format_filename(device.name, event)))
-            echo("\t{}/{} Downloading {}".format(counter, len(events), filename))
+            # existing files are skipped without sending a request
+            if Path(filename).exists():
+                skipped += 1
+                echo("\tSkipping existing {}".format(filename))
+                continue
+            jobs.append((device, event, filename))
+
+    echo(
+        f"\tDownloading {len(jobs)} videos linked on your Ring account.\n"
+        + "\tThis may take some time....\n"
+    )
 
-            device.recording_download(event["id"], filename=filename, override=False)
+    def _download(job):
+        device, event, filename = job
+        started = time.monotonic()
+        if not device.recording_download(
+            event["id"], filename=filename, override=False
+        ):
+            return None
+        try:
+            size = Path(filename).stat().st_size
+        except OSError:
+            size = 0
+        return size, time.monotonic() - started
+
+    started = time.monotonic()
+    total_bytes = 0
+    failed = 0
+    with ThreadPoolExecutor(max_workers=workers) as executor:
+        futures = {executor.submit(_download, job): job for job in jobs}
+        for counter, future in enumerate(as_completed(futures), start=1):
+            filename = futures[future][2]
+            try:
+                result = future.result()
+            except Exception as ex:  # pylint: disable=broad-exception-caught
+                failed += 1
+                echo("\t{}/{} Failed {}: {!r}".format(counter, len(jobs), filename, ex))
+                continue
+            if result is None:
+                failed += 1
+                echo("\t{}/{} Failed {}".format(counter, len(jobs), filename))
+                continue
+            size, elapsed = result
+            total_bytes += size
+            echo(
+                "\t{}/{} Downloaded {} ({:.1f} MB in {:.1f}s)".format(
+                    counter, len(jobs), filename, size / 1e6, elapsed
+                )
+            )
+
+    elapsed = max(time.monotonic() - started, 1e-6)
+    echo(
+        "\tDownloaded {} videos, {:.1f} MB in {:.1f}s ({:.2f} MB/s), "
+        "{} skipped, {} failed".format(
+            len(jobs) - failed,
+            total_bytes / 1e6,
+            elapsed,
+            total_bytes / 1e6 / elapsed,
+            skipped,
+            failed,
+        )
+    )
 
 
 if __name__ == "__main__":
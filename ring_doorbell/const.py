@@ -1,6 +1,8 @@
 # coding: utf-8
 # vim:sw=4:ts=4:et:
 """Constants."""
+from types import MappingProxyType
+from typing import FrozenSet, NamedTuple, Optional
 
 
 class OAuth:
@@ -15,6 +17,26 @@ PACKAGE_NAME = "ring_doorbell"
 # timeout for HTTP requests
 TIMEOUT = 10
 
+# seconds before expiry the token is refreshed when auto_refresh is enabled
+DEFAULT_TOKEN_REFRESH_MARGIN = 300
+
+# connections kept open per host, above the concurrency of DEFAULT_MAX_WORKERS
+# so parallel history, health and download requests reuse warm connections
+DEFAULT_POOL_MAXSIZE = 16
+# transport retries of idempotent requests wait backoff * 2 ** attempt seconds
+DEFAULT_RETRY_BACKOFF = 0.5
+RETRY_STATUSES = (502, 503, 504)
+
+# number of events requested per history page when walking the history
+HISTORY_PAGE_SIZE = 100
+
+# maximum number of requests sent concurrently when fanning out queries
+# e.g. one groups query per location
+DEFAULT_MAX_WORKERS = 8
+
+# seconds device health data is kept by Ring.update_health
+DEFAULT_HEALTH_TTL = 300
+
 # longer default timeout for recording downloads - typical video file sizes
 # are ~12 MB and empirical testing reveals a ~20 second download time over a
 # fast connection, suggesting speed is largely governed by capacity of Ring
@@ -22,6 +44,27 @@ TIMEOUT = 10
 # minutes (this default can be overridden in method call)
 DEFAULT_VIDEO_DOWNLOAD_TIMEOUT = 120
 
+# recordings are streamed to their destination in chunks of this size so
+# memory use stays flat regardless of the video file size
+DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE = 64 * 1024
+
+# seconds between polls of each data class by RingPoller while idle, the
+# fastest interval used while there is activity, and the longest backoff
+# after errors
+DEFAULT_POLL_INTERVALS = {"dings": 10, "devices": 120, "groups": 600, "health": 1800}
+DEFAULT_POLL_MIN_INTERVALS = {"dings": 2, "devices": 15, "groups": 60, "health": 600}
+DEFAULT_POLL_MAX_INTERVAL = 3600
+# seconds polling stays fast after the last activity was seen
+POLL_ACTIVITY_WINDOW = 120
+
+# seconds RingEventListener waits before reconnecting, doubled after every
+# failed attempt, and between dings polls while disconnected
+DEFAULT_LISTENER_MIN_BACKOFF = 1
+DEFAULT_LISTENER_MAX_BACKOFF = 300
+DEFAULT_LISTENER_FALLBACK_INTERVAL = 10
+# number of recent ding ids remembered so no ding is dispatched twice
+LISTENER_SEEN_DINGS = 1000
+
 
 # API endpoints
 API_VERSION = "9"
@@ -52,6 +95,16 @@ URL_RECORDING_SHARE_PLAY = "/clients_api/dings/{0}/share/play"
 GROUP_DEVICES_ENDPOINT = GROUPS_ENDPOINT + "/{1}/devices"
 SETTINGS_ENDPOINT = "/devices/v1/devices/{0}/settings"
 
+# seconds ResponseCache keeps GET responses per endpoint template
+DEFAULT_CACHE_TTLS = {
+    LINKED_CHIMES_ENDPOINT: 60,
+    GROUP_DEVICES_ENDPOINT: 10,
+    HEALTH_DOORBELL_ENDPOINT: 60,
+    HEALTH_CHIMES_ENDPOINT: 60,
+}
+DEFAULT_CACHE_MAX_ENTRIES = 256
+DEFAULT_CACHE_MAX_BYTES = 4 * 1024 * 1024
+
 # chime test sound kinds
 KIND_DING = "ding"
 KIND_MOTION = "motion"
@@ -91,6 +144,76 @@ STICKUP_CAM_BATTERY_KINDS = ["cocoa_camera", "stickup_cam_lunar"]
 STICKUP_CAM_WIRED_KINDS = ["stickup_cam_elite"]
 BEAM_KINDS = ["beams_ct200_transformer"]
 
+
+class KindInfo(NamedTuple):
+    """Model name and capabilities of a device kind."""
+
+    model: Optional[str]
+    capabilities: FrozenSet[str]
+
+
+def _kind_table(*entries):
+    table = {}
+    for kinds, model, capabilities in entries:
+        for kind in kinds:
+            table[kind] = KindInfo(model, frozenset(capabilities))
+    return MappingProxyType(table)
+
+
+_DOORBELL_CAPABILITIES = ("battery", "motion_detection", "video")
+_CAMERA_CAPABILITIES = ("siren", "motion_detection", "video")
+
+# precomputed lookup of every known kind, shared by all device classes
+KIND_INFO = _kind_table(
+    (CHIME_KINDS, "Chime", ()),
+    (CHIME_PRO_KINDS, "Chime Pro", ()),
+    (DOORBELL_KINDS, "Doorbell", _DOORBELL_CAPABILITIES),
+    (DOORBELL_2_KINDS, "Doorbell 2", _DOORBELL_CAPABILITIES),
+    (DOORBELL_3_KINDS, "Doorbell 3", _DOORBELL_CAPABILITIES),
+    (DOORBELL_3_PLUS_KINDS, "Doorbell 3 Plus", _DOORBELL_CAPABILITIES + ("pre-roll",)),
+    (DOORBELL_PRO_KINDS, "Doorbell Pro", ()),
+    (DOORBELL_ELITE_KINDS, "Doorbell Elite", ()),
+    (PEEPHOLE_CAM_KINDS, "Peephole Cam", _DOORBELL_CAPABILITIES + ("knock",)),
+    (FLOODLIGHT_CAM_KINDS, "Floodlight Cam", _CAMERA_CAPABILITIES + ("light",)),
+    (
+        FLOODLIGHT_CAM_PRO_KINDS,
+        "Floodlight Cam Pro",
+        _CAMERA_CAPABILITIES + ("light",),
+    ),
+    (INDOOR_CAM_KINDS, "Indoor Cam", _CAMERA_CAPABILITIES),
+    (
+        SPOTLIGHT_CAM_BATTERY_KINDS,
+        "Spotlight Cam Battery",
+        _CAMERA_CAPABILITIES + ("light", "battery"),
+    ),
+    (
+        SPOTLIGHT_CAM_WIRED_KINDS,
+        "Spotlight Cam Wired",
+        _CAMERA_CAPABILITIES + ("light",),
+    ),
+    (STICKUP_CAM_KINDS, "Stick Up Cam", ("battery",)),
+    (
+        STICKUP_CAM_BATTERY_KINDS,
+        "Stick Up Cam Battery",
+        _CAMERA_CAPABILITIES + ("battery",),
+    ),
+    (STICKUP_CAM_WIRED_KINDS, "Stick Up Cam Wired", _CAMERA_CAPABILITIES),
+)
+UNKNOWN_KIND = KindInfo(None, frozenset())
+SPOTLIGHT_CAM_KINDS = frozenset(SPOTLIGHT_CAM_BATTERY_KINDS + SPOTLIGHT_CAM_WIRED_KINDS)
+
+# capabilities reported by has_capability
+CAPABILITIES = (
+    "battery",
+    "knock",
+    "light",
+    "motion_detection",
+    "pre-roll",
+    "siren",
+    "video",
+    "volume",
+)
+
 # error strings
 MSG_BOOLEAN_REQUIRED = "Boolean value is required."
 MSG_EXISTING_TYPE = "Integer value where {0}.".format(DOORBELL_EXISTING_TYPE)
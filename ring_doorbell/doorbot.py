@@ -2,13 +2,17 @@
 # vim:sw=4:ts=4:et:
 """Python Ring Doorbell wrapper."""
 import logging
-from datetime import datetime
+from contextlib import nullcontext
+from http import HTTPStatus
+from itertools import islice
 import os
 import time
-import pytz
 
+import aiohttp
+import requests
 
-from ring_doorbell.generic import RingGeneric
+from ring_doorbell.event import HistoryEvent, get_timezone, parse_history_datetime
+from ring_doorbell.generic import RingGeneric, SettingsRequest
 
 from ring_doorbell.const import (
     DOORBELLS_ENDPOINT,
@@ -16,26 +20,21 @@ from ring_doorbell.const import (
     DOORBELL_VOL_MAX,
     DOORBELL_EXISTING_TYPE,
     DINGS_ENDPOINT,
-    DOORBELL_KINDS,
-    DOORBELL_2_KINDS,
-    DOORBELL_3_KINDS,
-    DOORBELL_3_PLUS_KINDS,
-    DOORBELL_PRO_KINDS,
-    DOORBELL_ELITE_KINDS,
     FILE_EXISTS,
+    HISTORY_PAGE_SIZE,
     LIVE_STREAMING_ENDPOINT,
     MSG_BOOLEAN_REQUIRED,
     MSG_EXISTING_TYPE,
     MSG_VOL_OUTBOUND,
     MSG_ALLOWED_VALUES,
     MSG_EXPECTED_ATTRIBUTE_NOT_FOUND,
-    PEEPHOLE_CAM_KINDS,
     SNAPSHOT_ENDPOINT,
     SNAPSHOT_TIMESTAMP_ENDPOINT,
     URL_DOORBELL_HISTORY,
     URL_RECORDING,
     URL_RECORDING_SHARE_PLAY,
     DEFAULT_VIDEO_DOWNLOAD_TIMEOUT,
+    DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE,
     HEALTH_DOORBELL_ENDPOINT,
     SETTINGS_ENDPOINT,
 )
@@ -46,6 +45,11 @@ _LOGGER = logging.getLogger(__name__)
 class RingDoorBell(RingGeneric):
     """Implementation for Ring Doorbell."""
 
+    _family_capabilities = frozenset(["volume"])
+    _kind_capabilities = frozenset(
+        ["battery", "knock", "motion_detection", "pre-roll", "video"]
+    )
+
     def __init__(self, ring, device_id, shared=False):
         super().__init__(ring, device_id)
         self.shared = shared
@@ -57,56 +61,14 @@ class RingDoorBell(RingGeneric):
 
     def update_health_data(self):
         """Update health attrs."""
-        self._health_attrs = (
-            self._ring.query(HEALTH_DOORBELL_ENDPOINT.format(self.id))
-            .json()
-            .get("device_health", {})
+        self._set_health_data(
+            self._ring.query(HEALTH_DOORBELL_ENDPOINT.format(self.id)).json()
         )
 
-    @property
-    def model(self):
-        """Return Ring device model name."""
-        if self.kind in DOORBELL_KINDS:
-            return "Doorbell"
-        if self.kind in DOORBELL_2_KINDS:
-            return "Doorbell 2"
-        if self.kind in DOORBELL_3_KINDS:
-            return "Doorbell 3"
-        if self.kind in DOORBELL_3_PLUS_KINDS:
-            return "Doorbell 3 Plus"
-        if self.kind in DOORBELL_PRO_KINDS:
-            return "Doorbell Pro"
-        if self.kind in DOORBELL_ELITE_KINDS:
-            return "Doorbell Elite"
-        if self.kind in PEEPHOLE_CAM_KINDS:
-            return "Peephole Cam"
-        return None
-
-    def has_capability(self, capability):
-        """Return if device has specific capability."""
-        if capability == "battery":
-            return self.kind in (
-                DOORBELL_KINDS
-                + DOORBELL_2_KINDS
-                + DOORBELL_3_KINDS
-                + DOORBELL_3_PLUS_KINDS
-                + PEEPHOLE_CAM_KINDS
-            )
-        if capability == "knock":
-            return self.kind in PEEPHOLE_CAM_KINDS
-        if capability == "pre-roll":
-            return self.kind in DOORBELL_3_PLUS_KINDS
-        if capability == "volume":
-            return True
-        if capability in ("motion_detection", "video"):
-            return self.kind in (
-                DOORBELL_KINDS
-                + DOORBELL_2_KINDS
-                + DOORBELL_3_KINDS
-                + DOORBELL_3_PLUS_KINDS
-                + PEEPHOLE_CAM_KINDS
-            )
-        return False
+    async def async_update_health_data(self):
+        """Update health attrs."""
+        response = await self._ring.query(HEALTH_DOORBELL_ENDPOINT.format(self.id))
+        self._set_health_data(await response.json())
 
     @property
     def battery_life(self):
@@ -161,20 +123,36 @@ class RingDoorBell(RingGeneric):
         1: Digital
         2: Not Present
         """
+        request = self._existing_doorbell_type_request(value)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_existing_doorbell_type(self, value):
+        """Set the existing doorbell type."""
+        request = self._existing_doorbell_type_request(value)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _existing_doorbell_type_request(self, value):
         # pylint:disable=consider-iterating-dictionary
         if value not in DOORBELL_EXISTING_TYPE.keys():
             _LOGGER.error("%s", MSG_EXISTING_TYPE)
-            return False
+            return None
+        if not self.existing_doorbell_type:
+            return None
         params = {
             "doorbot[description]": self.name,
             "doorbot[settings][chime_settings][type]": value,
         }
-        if self.existing_doorbell_type:
-            url = DOORBELLS_ENDPOINT.format(self.id)
-            self._ring.query(url, extra_params=params, method="PUT")
-            self._ring.update_devices()
-            return True
-        return None
+        return SettingsRequest(
+            DOORBELLS_ENDPOINT.format(self.id),
+            extra_params=params,
+            attrs={"settings": {"chime_settings": {"type": value}}},
+        )
 
     @property
     def existing_doorbell_type_enabled(self):
@@ -188,23 +166,40 @@ class RingDoorBell(RingGeneric):
     @existing_doorbell_type_enabled.setter
     def existing_doorbell_type_enabled(self, value):
         """Enable/disable the existing doorbell if Digital/Mechanical."""
-        if self.existing_doorbell_type:
-            if not isinstance(value, bool):
-                _LOGGER.error("%s", MSG_BOOLEAN_REQUIRED)
-                return None
+        request = self._existing_doorbell_type_enabled_request(value)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
 
-            if self.existing_doorbell_type == DOORBELL_EXISTING_TYPE[2]:
-                return None
+    async def async_set_existing_doorbell_type_enabled(self, value):
+        """Enable/disable the existing doorbell if Digital/Mechanical."""
+        request = self._existing_doorbell_type_enabled_request(value)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
 
-            params = {
-                "doorbot[description]": self.name,
-                "doorbot[settings][chime_settings][enable]": value,
-            }
-            url = DOORBELLS_ENDPOINT.format(self.id)
-            self._ring.query(url, extra_params=params, method="PUT")
-            self._ring.update_devices()
-            return True
-        return False
+    def _existing_doorbell_type_enabled_request(self, value):
+        if not self.existing_doorbell_type:
+            return None
+
+        if not isinstance(value, bool):
+            _LOGGER.error("%s", MSG_BOOLEAN_REQUIRED)
+            return None
+
+        if self.existing_doorbell_type == DOORBELL_EXISTING_TYPE[2]:
+            return None
+
+        params = {
+            "doorbot[description]": self.name,
+            "doorbot[settings][chime_settings][enable]": value,
+        }
+        return SettingsRequest(
+            DOORBELLS_ENDPOINT.format(self.id),
+            extra_params=params,
+            attrs={"settings": {"chime_settings": {"enable": value}}},
+        )
 
     @property
     def existing_doorbell_type_duration(self):
@@ -217,26 +212,44 @@ class RingDoorBell(RingGeneric):
     @existing_doorbell_type_duration.setter
     def existing_doorbell_type_duration(self, value):
         """Set duration for Digital chime."""
-        if self.existing_doorbell_type:
-            if not (
-                (isinstance(value, int))
-                and (DOORBELL_VOL_MIN <= value <= DOORBELL_VOL_MAX)
-            ):
-                _LOGGER.error(
-                    "%s", MSG_VOL_OUTBOUND.format(DOORBELL_VOL_MIN, DOORBELL_VOL_MAX)
-                )
-                return False
+        request = self._existing_doorbell_type_duration_request(value)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
 
-            if self.existing_doorbell_type == DOORBELL_EXISTING_TYPE[1]:
-                params = {
-                    "doorbot[description]": self.name,
-                    "doorbot[settings][chime_settings][duration]": value,
-                }
-                url = DOORBELLS_ENDPOINT.format(self.id)
-                self._ring.query(url, extra_params=params, method="PUT")
-                self._ring.update_devices()
-                return True
-        return None
+    async def async_set_existing_doorbell_type_duration(self, value):
+        """Set duration for Digital chime."""
+        request = self._existing_doorbell_type_duration_request(value)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _existing_doorbell_type_duration_request(self, value):
+        if not self.existing_doorbell_type:
+            return None
+
+        if not (
+            (isinstance(value, int)) and (DOORBELL_VOL_MIN <= value <= DOORBELL_VOL_MAX)
+        ):
+            _LOGGER.error(
+                "%s", MSG_VOL_OUTBOUND.format(DOORBELL_VOL_MIN, DOORBELL_VOL_MAX)
+            )
+            return None
+
+        if self.existing_doorbell_type != DOORBELL_EXISTING_TYPE[1]:
+            return None
+
+        params = {
+            "doorbot[description]": self.name,
+            "doorbot[settings][chime_settings][duration]": value,
+        }
+        return SettingsRequest(
+            DOORBELLS_ENDPOINT.format(self.id),
+            extra_params=params,
+            attrs={"settings": {"chime_settings": {"duration": value}}},
+        )
 
     def history(
         self,
@@ -247,7 +260,8 @@ class RingDoorBell(RingGeneric):
         older_than=None,
         retry=8,
         *,
-        convert_timezone=True
+        convert_timezone=True,
+        as_events=False
     ):
         """
         Return history with datetime objects.
@@ -257,75 +271,137 @@ class RingDoorBell(RingGeneric):
         :param kind: filter by kind (ding, motion, on_demand)
         :param enforce_limit: when True, this will enforce the limit and kind
         :param older_than: return older objects than the passed event_id
-        :param retry: determine the max number of attempts to archive the limit
+        :param retry: with enforce_limit, bounds the search to the
+            limit * 2 ** (retry - 1) most recent events, walked in pages of
+            at least HISTORY_PAGE_SIZE; capped at 10
+        :param as_events: return compact HistoryEvent objects instead of dicts
         """
-        queries = 0
-        original_limit = limit
-
-        # set cap for max queries
-        # pylint:disable=consider-using-min-builtin
-        if retry > 10:
-            retry = 10
-
-        while True:
-            params = {"limit": str(limit)}
-            if older_than:
-                params["older_than"] = older_than
-
-            url = URL_DOORBELL_HISTORY.format(self.id)
-            response = self._ring.query(url, extra_params=params).json()
-
-            # cherrypick only the selected kind events
-            if kind:
-                response = list(filter(lambda array: array["kind"] == kind, response))
-
-            if convert_timezone:
-                # convert for specific timezone
-                utc = pytz.utc
-                if timezone:
-                    mytz = pytz.timezone(timezone)
-
-                for entry in response:
-                    dt_at = datetime.strptime(
-                        entry["created_at"], "%Y-%m-%dT%H:%M:%S.000Z"
-                    )
-                    utc_dt = datetime(
-                        dt_at.year,
-                        dt_at.month,
-                        dt_at.day,
-                        dt_at.hour,
-                        dt_at.minute,
-                        dt_at.second,
-                        tzinfo=utc,
-                    )
-                    if timezone:
-                        tz_dt = utc_dt.astimezone(mytz)
-                        entry["created_at"] = tz_dt
-                    else:
-                        entry["created_at"] = utc_dt
-
-            if enforce_limit:
-                # return because already matched the number
-                # of events by kind
-                if len(response) >= original_limit:
-                    return response[:original_limit]
-
-                # ensure the loop will exit after max queries
-                queries += 1
-                if queries == retry:
-                    _LOGGER.debug(
-                        "Could not find total of %s of kind %s", original_limit, kind
-                    )
-                    break
+        page_size, max_pages = _history_pages(limit, enforce_limit, retry)
+        events = self.iter_history(
+            kind=kind,
+            page_size=page_size,
+            older_than=older_than,
+            timezone=timezone,
+            convert_timezone=convert_timezone,
+            max_pages=max_pages,
+            as_events=as_events,
+        )
+        response = list(islice(events, limit) if enforce_limit else events)
+        if enforce_limit and len(response) < limit:
+            _LOGGER.debug("Could not find total of %s of kind %s", limit, kind)
+        return response
+
+    def iter_history(
+        self,
+        kind=None,
+        page_size=HISTORY_PAGE_SIZE,
+        older_than=None,
+        timezone=None,
+        *,
+        convert_timezone=True,
+        max_pages=None,
+        as_events=False
+    ):
+        """
+        Yield history events, newest first, fetching pages as they are consumed.
 
-                # ensure the kind objects returned to match limit
-                limit = limit * 2
+        Pages are walked with the older_than cursor so no page is fetched
+        twice and nothing is fetched once the caller stops iterating.
 
-            else:
-                break
+        :param kind: filter by kind (ding, motion, on_demand)
+        :param page_size: number of events requested per page
+        :param older_than: start with events older than the passed event_id
+        :param timezone: determine which timezone to convert data objects
+        :param max_pages: maximum number of pages to fetch
+        :param as_events: yield compact HistoryEvent objects instead of dicts
+        """
+        url = URL_DOORBELL_HISTORY.format(self.id)
+        previous_ids = set()
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            page = self._ring.query(
+                url, extra_params=_history_params(page_size, older_than)
+            ).json()
+            pages += 1
+            last_page = len(page) < page_size
+            page, previous_ids, older_than = _next_history_page(page, previous_ids)
+            if not page:
+                return
+            yield from _process_history(
+                page, kind, timezone, convert_timezone, as_events, self.id
+            )
+            if last_page:
+                return
+
+    async def async_history(
+        self,
+        limit=30,
+        timezone=None,
+        kind=None,
+        enforce_limit=False,
+        older_than=None,
+        retry=8,
+        *,
+        convert_timezone=True,
+        as_events=False
+    ):
+        """Return history with datetime objects.
 
+        See :meth:`history` for the parameters.
+        """
+        response = []
+        page_size, max_pages = _history_pages(limit, enforce_limit, retry)
+        async for event in self.async_iter_history(
+            kind=kind,
+            page_size=page_size,
+            older_than=older_than,
+            timezone=timezone,
+            convert_timezone=convert_timezone,
+            max_pages=max_pages,
+            as_events=as_events,
+        ):
+            response.append(event)
+            if enforce_limit and len(response) >= limit:
+                break
+        if enforce_limit and len(response) < limit:
+            _LOGGER.debug("Could not find total of %s of kind %s", limit, kind)
         return response
 
+    async def async_iter_history(
+        self,
+        kind=None,
+        page_size=HISTORY_PAGE_SIZE,
+        older_than=None,
+        timezone=None,
+        *,
+        convert_timezone=True,
+        max_pages=None,
+        as_events=False
+    ):
+        """Yield history events, newest first, fetching pages as they are consumed.
+
+        See :meth:`iter_history` for the parameters.
+        """
+        url = URL_DOORBELL_HISTORY.format(self.id)
+        previous_ids = set()
+        pages = 0
+        while max_pages is None or pages < max_pages:
+            response = await self._ring.query(
+                url, extra_params=_history_params(page_size, older_than)
+            )
+            pages += 1
+            page = await response.json()
+            last_page = len(page) < page_size
+            page, previous_ids, older_than = _next_history_page(page, previous_ids)
+            if not page:
+                return
+            for event in _process_history(
+                page, kind, timezone, convert_timezone, as_events, self.id
+            ):
+                yield event
+            if last_page:
+                return
+
     @property
     def last_recording_id(self):
         """Return the last recording ID."""
@@ -353,8 +429,13 @@ class RingDoorBell(RingGeneric):
         filename=None,
         override=False,
         timeout=DEFAULT_VIDEO_DOWNLOAD_TIMEOUT,
+        chunk_size=DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE,
     ):
-        """Save a recording in MP4 format to a file or return raw."""
+        """Save a recording in MP4 format to a file or return raw.
+
+        :param filename: path or writable binary file object, the recording
+            is streamed to it chunk by chunk
+        """
         if not self.has_subscription:
             msg = "Your Ring account does not have an active subscription."
             _LOGGER.warning(msg)
@@ -362,24 +443,147 @@ class RingDoorBell(RingGeneric):
 
         url = URL_RECORDING.format(recording_id)
         try:
-            # Video download needs a longer timeout to get the large video file
-            req = self._ring.query(url, timeout=timeout)
-            if req and req.status_code == 200:
-                if filename:
-                    if os.path.isfile(filename) and not override:
-                        _LOGGER.error("%s", FILE_EXISTS.format(filename))
-                        return False
+            if not filename:
+                # Video download needs a longer timeout to get the large video file
+                req = self._ring.query(url, timeout=timeout)
+                if req and req.status_code == 200:
+                    return req.content
+                return False
 
-                    with open(filename, "wb") as recording:
-                        recording.write(req.content)
+            if _file_exists(filename, override):
+                return False
+
+            if hasattr(filename, "write"):
+                with self._ring.query(url, timeout=timeout, stream=True) as req:
+                    if req.status_code == 200:
+                        _write_chunks(req.iter_content(chunk_size), filename)
                         return True
-                else:
-                    return req.content
+                return False
+
+            part, offset = _partial_download(filename)
+            try:
+                req = self._ring.query(
+                    url,
+                    timeout=timeout,
+                    stream=True,
+                    extra_headers=_range_headers(offset),
+                )
+            except requests.HTTPError as err:
+                if not _discard_unsatisfiable(part, offset, err.response.status_code):
+                    raise
+                # hand the streamed connection back to the pool
+                err.response.close()
+                offset = 0
+                req = self._ring.query(url, timeout=timeout, stream=True)
+            with req:
+                if req.status_code in (200, 206):
+                    mode = _resume_mode(
+                        part, req.status_code, req.headers.get("Content-Range"), offset
+                    )
+                    with open(part, mode) as recording:
+                        for chunk in req.iter_content(chunk_size):
+                            recording.write(chunk)
+                    os.replace(part, filename)
+                    return True
+        except IOError as error:
+            _LOGGER.error("%s", error)
+            raise
+        return False
+
+    def recording_stream(
+        self,
+        recording_id,
+        timeout=DEFAULT_VIDEO_DOWNLOAD_TIMEOUT,
+        chunk_size=DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE,
+    ):
+        """Yield a recording in MP4 format chunk by chunk as it arrives."""
+        if not self.has_subscription:
+            msg = "Your Ring account does not have an active subscription."
+            _LOGGER.warning(msg)
+            return
+
+        url = URL_RECORDING.format(recording_id)
+        with self._ring.query(url, timeout=timeout, stream=True) as req:
+            yield from req.iter_content(chunk_size)
+
+    async def async_recording_download(
+        self,
+        recording_id,
+        filename=None,
+        override=False,
+        timeout=DEFAULT_VIDEO_DOWNLOAD_TIMEOUT,
+        chunk_size=DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE,
+    ):
+        """Save a recording in MP4 format to a file or return raw."""
+        if not self.has_subscription:
+            msg = "Your Ring account does not have an active subscription."
+            _LOGGER.warning(msg)
+            return False
+
+        url = URL_RECORDING.format(recording_id)
+        try:
+            if not filename:
+                req = await self._ring.query(url, timeout=timeout)
+                if req.status == 200:
+                    return await req.read()
+                return False
+
+            if _file_exists(filename, override):
+                return False
+
+            if hasattr(filename, "write"):
+                part, offset, headers = None, 0, None
+            else:
+                part, offset = _partial_download(filename)
+                headers = _range_headers(offset)
+
+            try:
+                req = await self._ring.query(
+                    url, timeout=timeout, stream=True, extra_headers=headers
+                )
+            except aiohttp.ClientResponseError as err:
+                if not _discard_unsatisfiable(part, offset, err.status):
+                    raise
+                offset = 0
+                req = await self._ring.query(url, timeout=timeout, stream=True)
+            async with req:
+                if req.status == 200 or (part and req.status == 206):
+                    if part is None:
+                        recording = nullcontext(filename)
+                    else:
+                        mode = _resume_mode(
+                            part, req.status, req.headers.get("Content-Range"), offset
+                        )
+                        # pylint:disable-next=consider-using-with
+                        recording = open(part, mode)
+                    with recording as target:
+                        async for chunk in req.content.iter_chunked(chunk_size):
+                            target.write(chunk)
+                    if part is not None:
+                        os.replace(part, filename)
+                    return True
         except IOError as error:
             _LOGGER.error("%s", error)
             raise
         return False
 
+    async def async_recording_stream(
+        self,
+        recording_id,
+        timeout=DEFAULT_VIDEO_DOWNLOAD_TIMEOUT,
+        chunk_size=DEFAULT_VIDEO_DOWNLOAD_CHUNK_SIZE,
+    ):
+        """Yield a recording in MP4 format chunk by chunk as it arrives."""
+        if not self.has_subscription:
+            msg = "Your Ring account does not have an active subscription."
+            _LOGGER.warning(msg)
+            return
+
+        url = URL_RECORDING.format(recording_id)
+        async with await self._ring.query(url, timeout=timeout, stream=True) as req:
+            async for chunk in req.content.iter_chunked(chunk_size):
+                yield chunk
+
     def recording_url(self, recording_id):
         """Return HTTPS recording URL."""
         if not self.has_subscription:
@@ -394,6 +598,20 @@ class RingDoorBell(RingGeneric):
             return data["url"]
         return False
 
+    async def async_recording_url(self, recording_id):
+        """Return HTTPS recording URL."""
+        if not self.has_subscription:
+            msg = "Your Ring account does not have an active subscription."
+            _LOGGER.warning(msg)
+            return False
+
+        url = URL_RECORDING_SHARE_PLAY.format(recording_id)
+        req = await self._ring.query(url)
+        data = await req.json()
+        if req.status == 200 and data is not None:
+            return data["url"]
+        return False
+
     @property
     def subscribed(self):
         """Return if is online."""
@@ -422,22 +640,38 @@ class RingDoorBell(RingGeneric):
 
     @volume.setter
     def volume(self, value):
+        request = self._volume_request(value)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_volume(self, value):
+        """Set the doorbell volume."""
+        request = self._volume_request(value)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _volume_request(self, value):
         if not (
             (isinstance(value, int)) and (DOORBELL_VOL_MIN <= value <= DOORBELL_VOL_MAX)
         ):
             _LOGGER.error(
                 "%s", MSG_VOL_OUTBOUND.format(DOORBELL_VOL_MIN, DOORBELL_VOL_MAX)
             )
-            return False
+            return None
 
         params = {
             "doorbot[description]": self.name,
             "doorbot[settings][doorbell_volume]": str(value),
         }
-        url = DOORBELLS_ENDPOINT.format(self.id)
-        self._ring.query(url, extra_params=params, method="PUT")
-        self._ring.update_devices()
-        return True
+        return SettingsRequest(
+            DOORBELLS_ENDPOINT.format(self.id),
+            extra_params=params,
+            attrs={"settings": {"doorbell_volume": value}},
+        )
 
     @property
     def connection_status(self):
@@ -479,10 +713,25 @@ class RingDoorBell(RingGeneric):
     @motion_detection.setter
     def motion_detection(self, state):
         """Set the motion detection enabled state."""
+        request = self._motion_detection_request(state)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_motion_detection(self, state):
+        """Set the motion detection enabled state."""
+        request = self._motion_detection_request(state)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _motion_detection_request(self, state):
         values = [True, False]
         if state not in values:
-            _LOGGER.error("%s", MSG_ALLOWED_VALUES.format(", ".join(values)))
-            return False
+            _LOGGER.error("%s", MSG_ALLOWED_VALUES.format(", ".join(map(str, values))))
+            return None
 
         if self._motion_detection_state() is None:
             _LOGGER.warning(
@@ -491,11 +740,136 @@ class RingDoorBell(RingGeneric):
                     "settings[motion_detection_enabled]"
                 ),
             )
-            return False
+            return None
 
         url = SETTINGS_ENDPOINT.format(self.id)
         payload = {"motion_settings": {"motion_detection_enabled": state}}
+        return SettingsRequest(
+            url,
+            method="PATCH",
+            json=payload,
+            attrs={"settings": {"motion_detection_enabled": state}},
+        )
+
+
+def _history_pages(limit, enforce_limit, retry):
+    """Return the page size and number of pages history() may fetch.
+
+    With enforce_limit the search reaches as deep as the doubling queries
+    of earlier releases did, limit * 2 ** (retry - 1) events.
+    """
+    if not enforce_limit:
+        return limit, 1
+    # set cap for max queries
+    depth = limit * 2 ** (max(min(retry, 10), 1) - 1)
+    page_size = max(limit, HISTORY_PAGE_SIZE)
+    return page_size, max(-(-depth // page_size), 1)
 
-        self._ring.query(url, method="PATCH", json=payload)
-        self._ring.update_devices()
+
+def _next_history_page(page, previous_ids):
+    """Drop events repeated from the previous page and return the next cursor.
+
+    The API may include the older_than event itself in the next page.
+    """
+    page = [event for event in page if event["id"] not in previous_ids]
+    if not page:
+        return page, previous_ids, None
+    return page, {event["id"] for event in page}, page[-1]["id"]
+
+
+def _history_params(limit, older_than):
+    params = {"limit": str(limit)}
+    if older_than:
+        params["older_than"] = older_than
+    return params
+
+
+def _process_history(
+    response, kind, timezone, convert_timezone, as_events=False, device_id=None
+):
+    """Filter history entries by kind and convert their timestamps."""
+    # cherrypick only the selected kind events
+    if kind:
+        response = [entry for entry in response if entry["kind"] == kind]
+
+    if as_events:
+        # created_at is converted lazily by the event
+        return [
+            HistoryEvent.from_dict(entry, device_id, timezone) for entry in response
+        ]
+
+    if convert_timezone:
+        mytz = get_timezone(timezone)
+        for entry in response:
+            entry["created_at"] = parse_history_datetime(entry["created_at"], mytz)
+
+    return response
+
+
+def _file_exists(filename, override):
+    """Return True, logging an error, if filename must not be overwritten."""
+    if hasattr(filename, "write"):
+        return False
+    if os.path.isfile(filename) and not override:
+        _LOGGER.error("%s", FILE_EXISTS.format(filename))
         return True
+    return False
+
+
+def _partial_download(filename):
+    """Return the .part file of a download and the bytes already in it."""
+    part = os.fspath(filename) + ".part"
+    try:
+        return part, os.path.getsize(part)
+    except OSError:
+        return part, 0
+
+
+def _range_headers(offset):
+    if not offset:
+        return None
+    return {"Range": "bytes={}-".format(offset)}
+
+
+def _discard_unsatisfiable(part, offset, status):
+    """Remove a .part file the server refused to resume.
+
+    A run interrupted after the last chunk leaves a complete .part file,
+    its Range starts past the end and is answered with 416.
+
+    :return: whether the download has to be restarted from the first byte
+    """
+    if not offset or status != HTTPStatus.REQUESTED_RANGE_NOT_SATISFIABLE:
+        return False
+    _LOGGER.debug("Discarding %s, the server cannot resume it", part)
+    os.remove(part)
+    return True
+
+
+def _resume_mode(part, status, content_range, offset):
+    """Return the mode the .part file has to be opened with.
+
+    Appends when the server honoured the Range request, otherwise the
+    download restarts from the first byte.
+    """
+    if status != 206 or not offset:
+        return "wb"
+
+    # Content-Range: bytes <start>-<end>/<size>
+    try:
+        start = int(content_range.split()[1].split("-")[0])
+    except (AttributeError, IndexError, ValueError):
+        start = None
+
+    if start == offset:
+        return "ab"
+    if start == 0:
+        return "wb"
+
+    os.remove(part)
+    raise IOError("Unexpected Content-Range {} for {}".format(content_range, part))
+
+
+def _write_chunks(chunks, fileobj):
+    for chunk in chunks:
+        fileobj.write(chunk)
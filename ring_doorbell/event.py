@@ -0,0 +1,129 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring history event wrapper."""
+from datetime import datetime, tzinfo
+from functools import lru_cache
+import sys
+
+import pytz
+
+
+@lru_cache(maxsize=None)
+def get_timezone(name=None):
+    """Return the cached tzinfo for a timezone name, UTC if name is None."""
+    if name is None:
+        return pytz.utc
+    return pytz.timezone(name)
+
+
+def parse_history_datetime(value, timezone=None):
+    """Convert a history created_at value to an aware datetime.
+
+    Pass convert_timezone=False to the history methods to defer this
+    conversion until the value is needed.
+
+    :param value: timestamp in the ``2017-03-05T15:03:40.000Z`` format
+    :param timezone: timezone name or tzinfo to convert to, default UTC
+    """
+    if isinstance(value, datetime):
+        return value
+    if not isinstance(timezone, tzinfo):
+        timezone = get_timezone(timezone)
+    # fromisoformat is implemented in C, sub-second precision is dropped
+    utc_dt = datetime.fromisoformat(value[:19]).replace(tzinfo=pytz.utc)
+    if timezone is pytz.utc:
+        return utc_dt
+    return utc_dt.astimezone(timezone)
+
+
+class HistoryEvent:
+    """Compact representation of a history event.
+
+    Only the commonly used fields are kept, nested payloads such as the
+    doorbot description or recording metadata are dropped. created_at is
+    converted to a datetime on first access.
+    """
+
+    __slots__ = (
+        "id",
+        "kind",
+        "answered",
+        "duration",
+        "device_id",
+        "_created_at",
+        "_timezone",
+    )
+
+    # pylint: disable=redefined-builtin
+    # pylint:disable=invalid-name
+    def __init__(
+        self, id, kind, created_at, answered=None, duration=None, device_id=None
+    ):
+        """Initialize the event.
+
+        :param created_at: datetime or the raw created_at value of the API
+        """
+        self.id = id
+        self.kind = sys.intern(kind) if isinstance(kind, str) else kind
+        self.answered = answered
+        self.duration = duration
+        self.device_id = device_id
+        self._created_at = created_at
+        self._timezone = None
+
+    @classmethod
+    def from_dict(cls, data, device_id=None, timezone=None):
+        """Create an event from a history API entry.
+
+        :param device_id: used when the entry has no doorbot block
+        :param timezone: timezone created_at is converted to when accessed
+        """
+        doorbot = data.get("doorbot") or {}
+        event = cls(
+            data["id"],
+            data.get("kind"),
+            data.get("created_at"),
+            answered=data.get("answered"),
+            duration=data.get("duration"),
+            device_id=doorbot.get("id", device_id),
+        )
+        event._timezone = timezone
+        return event
+
+    @property
+    def created_at(self):
+        """Return the creation time as an aware datetime."""
+        if isinstance(self._created_at, str):
+            self._created_at = parse_history_datetime(self._created_at, self._timezone)
+        return self._created_at
+
+    def to_dict(self):
+        """Return the event in the format of the history API.
+
+        Only the fields kept by the event are included.
+        """
+        created_at = self._created_at
+        if isinstance(created_at, datetime):
+            created_at = created_at.astimezone(pytz.utc).strftime(
+                "%Y-%m-%dT%H:%M:%S.000Z"
+            )
+        return {
+            "id": self.id,
+            "kind": self.kind,
+            "created_at": created_at,
+            "answered": self.answered,
+            "duration": self.duration,
+            "doorbot": {"id": self.device_id},
+        }
+
+    def __eq__(self, other):
+        if not isinstance(other, HistoryEvent):
+            return NotImplemented
+        return self.id == other.id and self.device_id == other.device_id
+
+    def __hash__(self):
+        return hash((self.id, self.device_id))
+
+    def __repr__(self):
+        """Return __repr__."""
+        return "<{0}: {1} {2}>".format(self.__class__.__name__, self.kind, self.id)
@@ -0,0 +1,236 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring local event index."""
+import json
+import logging
+import sqlite3
+from ring_doorbell.const import HISTORY_PAGE_SIZE
+from ring_doorbell.event import parse_history_datetime
+
+_LOGGER = logging.getLogger(__name__)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS events (
+    device_id INTEGER NOT NULL,
+    id INTEGER NOT NULL,
+    kind TEXT,
+    created_at REAL,
+    answered INTEGER,
+    data TEXT NOT NULL,
+    PRIMARY KEY (device_id, id)
+);
+CREATE INDEX IF NOT EXISTS events_by_time ON events (device_id, created_at);
+CREATE TABLE IF NOT EXISTS sync_state (
+    device_id INTEGER PRIMARY KEY,
+    complete INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+
+class RingEventStore:
+    """A persistent SQLite index of the event history of devices.
+
+    Once a device has been synced, only events newer than the ones already
+    stored are paged from the API and counts or lookups are answered
+    locally.
+    """
+
+    def __init__(self, path):
+        """Open or create the index stored at path."""
+        self.path = path
+        self._conn = sqlite3.connect(path)
+        self._conn.executescript(_SCHEMA)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def close(self):
+        """Close the underlying database."""
+        self._conn.close()
+
+    def sync(self, device, page_size=HISTORY_PAGE_SIZE):
+        """Fetch the events of device which are not stored yet.
+
+        Pages from the newest event down to the first already known one.
+        The first sync of a device, or one resuming an interrupted
+        backfill, then continues down to the oldest event.
+
+        :return: number of events added
+        """
+        events = device.iter_history(page_size=page_size, convert_timezone=False)
+        added, reached_known = self._store(device.id, events, page_size)
+
+        if reached_known and not self._is_complete(device.id):
+            events = device.iter_history(
+                page_size=page_size,
+                older_than=self._oldest_id(device.id),
+                convert_timezone=False,
+            )
+            added += self._store(device.id, events, page_size, stop_at_known=False)[0]
+
+        self._set_complete(device.id)
+        _LOGGER.debug("Stored %s new events of %s", added, device)
+        return added
+
+    async def async_sync(self, device, page_size=HISTORY_PAGE_SIZE):
+        """Fetch the events of device which are not stored yet.
+
+        See :meth:`sync`.
+        """
+        events = device.async_iter_history(page_size=page_size, convert_timezone=False)
+        added, reached_known = await self._async_store(device.id, events, page_size)
+
+        if reached_known and not self._is_complete(device.id):
+            events = device.async_iter_history(
+                page_size=page_size,
+                older_than=self._oldest_id(device.id),
+                convert_timezone=False,
+            )
+            added += (await self._async_store(device.id, events, page_size, False))[0]
+
+        self._set_complete(device.id)
+        _LOGGER.debug("Stored %s new events of %s", added, device)
+        return added
+
+    def _store(self, device_id, events, page_size, stop_at_known=True):
+        """Store events a page at a time.
+
+        :return: number of events added and whether a known event was reached
+        """
+        added = 0
+        batch = []
+        for event in events:
+            if stop_at_known and self._is_known(device_id, event["id"]):
+                # reached the events of a previous sync
+                return added + self._insert(device_id, batch), True
+            batch.append(event)
+            if len(batch) >= page_size:
+                added += self._insert(device_id, batch)
+                batch = []
+        return added + self._insert(device_id, batch), False
+
+    async def _async_store(self, device_id, events, page_size, stop_at_known=True):
+        added = 0
+        batch = []
+        async for event in events:
+            if stop_at_known and self._is_known(device_id, event["id"]):
+                await events.aclose()
+                return added + self._insert(device_id, batch), True
+            batch.append(event)
+            if len(batch) >= page_size:
+                added += self._insert(device_id, batch)
+                batch = []
+        return added + self._insert(device_id, batch), False
+
+    def _is_known(self, device_id, event_id):
+        return (
+            self._conn.execute(
+                "SELECT 1 FROM events WHERE device_id = ? AND id = ?",
+                (device_id, event_id),
+            ).fetchone()
+            is not None
+        )
+
+    def _insert(self, device_id, events):
+        """Store events, returning how many were not known yet."""
+        with self._conn:
+            before = self._conn.total_changes
+            self._conn.executemany(
+                "INSERT OR IGNORE INTO events "
+                "(device_id, id, kind, created_at, answered, data) "
+                "VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (
+                        device_id,
+                        event["id"],
+                        event.get("kind"),
+                        _timestamp(event.get("created_at")),
+                        event.get("answered"),
+                        json.dumps(event),
+                    )
+                    for event in events
+                ],
+            )
+            return self._conn.total_changes - before
+
+    def _oldest_id(self, device_id):
+        row = self._conn.execute(
+            "SELECT id FROM events WHERE device_id = ? "
+            "ORDER BY created_at, id LIMIT 1",
+            (device_id,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def _is_complete(self, device_id):
+        row = self._conn.execute(
+            "SELECT complete FROM sync_state WHERE device_id = ?", (device_id,)
+        ).fetchone()
+        return bool(row and row[0])
+
+    def _set_complete(self, device_id):
+        with self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO sync_state (device_id, complete) "
+                "VALUES (?, 1)",
+                (device_id,),
+            )
+
+    def count(self, device=None, kind=None, since=None, until=None):
+        """Return the number of stored events matching the filters."""
+        where, params = _filters(device, kind, since, until)
+        return self._conn.execute(
+            "SELECT COUNT(*) FROM events" + where, params
+        ).fetchone()[0]
+
+    def count_by_kind(self, device=None, since=None, until=None):
+        """Return a dict of kind to number of stored events."""
+        where, params = _filters(device, None, since, until)
+        return dict(
+            self._conn.execute(
+                "SELECT kind, COUNT(*) FROM events" + where + " GROUP BY kind",
+                params,
+            )
+        )
+
+    def events(self, device=None, kind=None, since=None, until=None, limit=None):
+        """Return the stored events matching the filters, newest first.
+
+        Events are returned as the raw dicts of the history API.
+        """
+        where, params = _filters(device, kind, since, until)
+        query = "SELECT data FROM events" + where
+        query += " ORDER BY created_at DESC, id DESC"
+        if limit is not None:
+            query += " LIMIT ?"
+            params.append(limit)
+        return [json.loads(row[0]) for row in self._conn.execute(query, params)]
+
+
+def _timestamp(value):
+    """Return a UTC epoch for a history created_at value."""
+    if value is None:
+        return None
+    return parse_history_datetime(value).timestamp()
+
+
+def _filters(device, kind, since, until):
+    clauses = []
+    params = []
+    if device is not None:
+        clauses.append("device_id = ?")
+        params.append(getattr(device, "id", device))
+    if kind is not None:
+        clauses.append("kind = ?")
+        params.append(kind)
+    if since is not None:
+        clauses.append("created_at >= ?")
+        params.append(_timestamp(since))
+    if until is not None:
+        clauses.append("created_at < ?")
+        params.append(_timestamp(until))
+    if not clauses:
+        return "", params
+    return " WHERE " + " AND ".join(clauses), params
@@ -1,15 +1,111 @@
 # coding: utf-8
 # vim:sw=4:ts=4:et:
 """Python Ring RingGeneric wrapper."""
+import copy
 import logging
+import time
+from typing import NamedTuple, Optional
+
+from ring_doorbell.changes import CHANGED, DeviceChange, diff_attrs
+from ring_doorbell.const import DEVICES_ENDPOINT, KIND_INFO, UNKNOWN_KIND
 
 _LOGGER = logging.getLogger(__name__)
 
+# kinds already reported as unknown
+_UNKNOWN_KINDS = set()
+
+
+class SettingsRequest(NamedTuple):
+    """A validated request changing device state."""
+
+    url: str
+    method: str = "PUT"
+    extra_params: Optional[dict] = None
+    json: Optional[dict] = None
+    # changes merged into the device attributes once the request succeeded
+    attrs: Optional[dict] = None
+    # requests with the same key replace each other in a batch, those
+    # without one are merged when they target the same url
+    key: Optional[str] = None
+
+
+class SettingsBatch:
+    """Collect the settings requests of a device and send them merged.
+
+    Use :meth:`RingGeneric.batch` to create one.
+    """
+
+    def __init__(self, device):
+        """Initialize the batch."""
+        self._device = device
+        self._requests = {}
+        self._depth = 0
+
+    def add(self, request):
+        """Queue a request, merging it with a queued one when possible."""
+        key = request.key or (request.method, request.url)
+        queued = self._requests.get(key)
+        if (
+            queued is not None
+            and queued.url == request.url
+            and queued.method == request.method
+        ):
+            request = queued._replace(
+                extra_params=_merged(queued.extra_params, request.extra_params),
+                json=_merged(queued.json, request.json),
+                attrs=_merged(queued.attrs, request.attrs),
+            )
+        else:
+            # a replaced request is sent after the ones queued before it
+            self._requests.pop(key, None)
+        self._requests[key] = request
+
+    @property
+    def requests(self):
+        """Return the merged requests in send order."""
+        return list(self._requests.values())
+
+    def _enter(self):
+        self._depth += 1
+        self._device._batch = self  # pylint:disable=protected-access
+        return self
+
+    def _exit(self, exc_type):
+        """Return the requests to send when the outermost block exits."""
+        self._depth -= 1
+        if self._depth:
+            return []
+        self._device._batch = None  # pylint:disable=protected-access
+        if exc_type is not None:
+            return []
+        return self.requests
+
+    def __enter__(self):
+        return self._enter()
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        for request in self._exit(exc_type):
+            # pylint:disable=protected-access
+            self._device._send_settings(request)
+
+    async def __aenter__(self):
+        return self._enter()
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        for request in self._exit(exc_type):
+            # pylint:disable=protected-access
+            await self._device._async_send_settings(request)
+
 
 # pylint: disable=useless-object-inheritance
 class RingGeneric(object):
     """Generic Implementation for Ring Chime/Doorbell."""
 
+    # capabilities of every kind of the device family
+    _family_capabilities = frozenset()
+    # capabilities the class implements, reported when the kind has them
+    _kind_capabilities = frozenset()
+
     # pylint: disable=redefined-builtin
     # pylint:disable=invalid-name
     def __init__(self, ring, id):
@@ -21,8 +117,11 @@ class RingGeneric(object):
         self.capability = False
         self.alert = None
         self._health_attrs = {}
+        # monotonic time of the last health data update
+        self._health_updated_at = None
+        self._batch = None
 
-        # alerts notifications
+        # active alert routed by Ring and its expiry as an epoch timestamp
         self.alert_expires_at = None
 
     def __repr__(self):
@@ -32,6 +131,12 @@ class RingGeneric(object):
     def __str__(self):
         return f"{self.name} ({self.kind})"
 
+    @property
+    def active_alert(self):
+        """Return the unexpired alert of the device or None."""
+        self._ring.expire_alerts()
+        return self.alert
+
     def update(self):
         """Update this device info."""
         self.update_health_data()
@@ -40,6 +145,98 @@ class RingGeneric(object):
         """Update the health data."""
         raise NotImplementedError
 
+    async def async_update_health_data(self):
+        """Update the health data."""
+        raise NotImplementedError
+
+    def _set_health_data(self, data):
+        self._health_attrs = data.get("device_health", {})
+        self._health_updated_at = time.monotonic()
+
+    def _health_is_stale(self, ttl):
+        """Return if the health data is older than ttl seconds."""
+        return (
+            self._health_updated_at is None
+            or time.monotonic() - self._health_updated_at >= ttl
+        )
+
+    def batch(self):
+        """Return a context manager sending the settings changed in it at once.
+
+        Setters called inside the block are queued and merged, e.g. all
+        ``doorbot[...]`` params go out in a single PUT. Nothing is sent when
+        the block raises. Works with ``with`` and ``async with``::
+
+            with doorbell.batch():
+                doorbell.volume = 5
+                doorbell.motion_detection = False
+        """
+        if self._batch is not None:
+            return self._batch
+        return SettingsBatch(self)
+
+    def _send_settings(self, request):
+        """Send a settings request and apply it to the device data.
+
+        The whole device list is not refreshed, changes are reconciled with
+        the server by the next update_devices.
+        """
+        if self._batch is not None:
+            self._batch.add(request)
+            return
+        response = self._ring.query(
+            request.url,
+            method=request.method,
+            extra_params=request.extra_params,
+            json=request.json,
+        )
+        try:
+            data = response.json()
+        except ValueError:
+            data = None
+        self._apply_settings(request, data)
+
+    async def _async_send_settings(self, request):
+        """Send a settings request and apply it to the device data."""
+        if self._batch is not None:
+            self._batch.add(request)
+            return
+        response = await self._ring.query(
+            request.url,
+            method=request.method,
+            extra_params=request.extra_params,
+            json=request.json,
+        )
+        try:
+            data = await response.json(content_type=None)
+        except ValueError:
+            data = None
+        self._apply_settings(request, data)
+
+    def _apply_settings(self, request, data=None):
+        """Update the device attributes after a settings request.
+
+        :param data: decoded response, used when it is the device state
+        """
+        if isinstance(data, dict) and data.get("id") == self.id:
+            changes = data
+        elif request.attrs:
+            changes = request.attrs
+        else:
+            return
+        # pylint:disable=protected-access
+        listened = bool(self._ring._device_listeners)
+        old_attrs = copy.deepcopy(self._attrs) if listened else None
+        _merge_attrs(self._attrs, changes)
+        # the cached body shares these dicts, a 304 must not keep the change
+        self._ring._forget_response(DEVICES_ENDPOINT)
+        if listened:
+            fields = diff_attrs(old_attrs, self._attrs)
+            if fields:
+                self._ring._notify_device_changes(
+                    [DeviceChange(self.family, self.id, CHANGED, fields)]
+                )
+
     @property
     def _attrs(self):
         """Return attributes."""
@@ -60,14 +257,29 @@ class RingGeneric(object):
         """Return Ring device family type."""
         raise NotImplementedError
 
+    @property
+    def _kind_info(self):
+        """Return the model and capabilities of the device kind."""
+        kind = self.kind
+        info = KIND_INFO.get(kind)
+        if info is None:
+            if kind not in _UNKNOWN_KINDS:
+                _UNKNOWN_KINDS.add(kind)
+                _LOGGER.error("Unknown kind: %s", kind)
+            return UNKNOWN_KIND
+        return info
+
     @property
     def model(self):
         """Return Ring device model name."""
-        raise NotImplementedError
+        return self._kind_info.model
 
     def has_capability(self, capability):
         """Return if device has specific capability."""
-        return self.capability
+        return capability in self._family_capabilities or (
+            capability in self._kind_capabilities
+            and capability in self._kind_info.capabilities
+        )
 
     @property
     def address(self):
@@ -122,3 +334,21 @@ class RingGeneric(object):
         Requires health data to be updated.
         """
         return self._health_attrs.get("latest_signal_category")
+
+
+def _merged(first, second):
+    """Return a deep merge of two optional dicts, second taking precedence."""
+    if first is None or second is None:
+        return second if first is None else first
+    merged = copy.deepcopy(first)
+    _merge_attrs(merged, second)
+    return merged
+
+
+def _merge_attrs(attrs, changes):
+    """Recursively merge changes into the attrs dict in place."""
+    for key, value in changes.items():
+        if isinstance(value, dict) and isinstance(attrs.get(key), dict):
+            _merge_attrs(attrs[key], value)
+        else:
+            attrs[key] = value
@@ -30,6 +30,13 @@ class RingLightGroup:
         self._health_attrs = self._ring.query(url).json()
         self._health_attrs_fetched = True
 
+    async def async_update(self):
+        """Update this device info."""
+        url = GROUP_DEVICES_ENDPOINT.format(self.location_id, self.id)
+        response = await self._ring.query(url)
+        self._health_attrs = await response.json()
+        self._health_attrs_fetched = True
+
     @property
     def _attrs(self):
         """Return attributes."""
@@ -77,6 +84,28 @@ class RingLightGroup:
     @lights.setter
     def lights(self, value):
         """Control the lights."""
+        payload = self._lights_payload(value)
+        if payload is None:
+            return False
+
+        url = GROUP_DEVICES_ENDPOINT.format(self.location_id, self.id)
+        self._ring.query(url, method="POST", json=payload)
+        self.update()
+        return True
+
+    async def async_set_lights(self, value):
+        """Control the lights."""
+        payload = self._lights_payload(value)
+        if payload is None:
+            return False
+
+        url = GROUP_DEVICES_ENDPOINT.format(self.location_id, self.id)
+        await self._ring.query(url, method="POST", json=payload)
+        await self.async_update()
+        return True
+
+    @staticmethod
+    def _lights_payload(value):
         values = ["True", "False"]
         state = None
         duration = None
@@ -86,12 +115,9 @@ class RingLightGroup:
             state = value
         if not isinstance(state, bool):
             _LOGGER.error("%s", MSG_ALLOWED_VALUES.format(", ".join(values)))
-            return False
+            return None
 
-        url = GROUP_DEVICES_ENDPOINT.format(self.location_id, self.id)
         payload = {"lights_on": {"enabled": state}}
         if duration is not None:
             payload["lights_on"]["duration_seconds"] = duration
-        self._ring.query(url, method="POST", json=payload)
-        self.update()
-        return True
+        return payload
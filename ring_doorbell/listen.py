@@ -0,0 +1,244 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring push event listener."""
+import asyncio
+from collections import deque
+import json
+import logging
+import socket
+import threading
+import time
+
+from ring_doorbell.const import (
+    DEFAULT_LISTENER_FALLBACK_INTERVAL,
+    DEFAULT_LISTENER_MAX_BACKOFF,
+    DEFAULT_LISTENER_MIN_BACKOFF,
+    LISTENER_SEEN_DINGS,
+    TIMEOUT,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+
+class JsonLinesTransport:
+    """Receive dings as JSON objects, one per line, over a TCP connection.
+
+    Events use the format of the active dings API. This is the transport
+    for a local push relay or a stand-in server. Any object providing
+    ``events()``, ``async_events()`` and ``close()`` can be used instead.
+    """
+
+    def __init__(self, host, port, timeout=TIMEOUT):
+        """Initialize the transport.
+
+        :param timeout: seconds to wait for the connection to be established
+        """
+        self.host = host
+        self.port = port
+        self.timeout = timeout
+        self._sock = None
+
+    def events(self):
+        """Connect and yield the received events until the connection ends."""
+        sock = socket.create_connection((self.host, self.port), self.timeout)
+        sock.settimeout(None)
+        self._sock = sock
+        try:
+            with sock.makefile("rb") as stream:
+                for line in stream:
+                    if line.strip():
+                        yield json.loads(line)
+        finally:
+            self._sock = None
+            sock.close()
+
+    async def async_events(self):
+        """Connect and yield the received events until the connection ends."""
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(self.host, self.port), self.timeout
+        )
+        try:
+            while True:
+                line = await reader.readline()
+                if not line:
+                    return
+                if line.strip():
+                    yield json.loads(line)
+        finally:
+            writer.close()
+
+    def close(self):
+        """Interrupt a blocking events() call."""
+        sock = self._sock
+        if sock is not None:
+            try:
+                sock.shutdown(socket.SHUT_RDWR)
+            except OSError:
+                pass
+
+
+class RingEventListener:
+    """Dispatch dings and motion events received over a push transport.
+
+    While the transport is disconnected, reconnection attempts back off
+    exponentially and the active dings are polled in between so no event
+    is missed. Every ding is passed to the callbacks once, whichever way it
+    arrived.
+
+    Use :meth:`start`/:meth:`stop` with :class:`Ring` and
+    :meth:`async_start`/:meth:`async_stop` with :class:`AsyncRing`.
+    """
+
+    def __init__(
+        self,
+        ring,
+        transport,
+        min_backoff=DEFAULT_LISTENER_MIN_BACKOFF,
+        max_backoff=DEFAULT_LISTENER_MAX_BACKOFF,
+        fallback_interval=DEFAULT_LISTENER_FALLBACK_INTERVAL,
+    ):
+        """Initialize the listener.
+
+        :param fallback_interval: seconds between dings polls while
+            disconnected, None disables polling
+        """
+        self._ring = ring
+        self._transport = transport
+        self.min_backoff = min_backoff
+        self.max_backoff = max_backoff
+        self.fallback_interval = fallback_interval
+        self._callbacks = []
+        self._seen = set()
+        self._seen_order = deque()
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._task = None
+
+    def add_callback(self, callback):
+        """Call callback with every new ding."""
+        self._callbacks.append(callback)
+
+    def remove_callback(self, callback):
+        """Stop calling a callback added with add_callback."""
+        self._callbacks.remove(callback)
+
+    def start(self):
+        """Start listening from a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ring-listener", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Disconnect and stop the listening thread."""
+        self._stop_event.set()
+        if self._thread is None:
+            return
+        # the thread may be connecting when close is first called
+        while self._thread.is_alive():
+            self._transport.close()
+            self._thread.join(0.1)
+        self._thread = None
+
+    async def async_start(self):
+        """Start listening from an asyncio task."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._async_run())
+
+    async def async_stop(self):
+        """Cancel the listening task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def _run(self):
+        backoff = self.min_backoff
+        while not self._stop_event.is_set():
+            try:
+                for event in self._transport.events():
+                    backoff = self.min_backoff
+                    self._dispatch(event)
+            except Exception as err:  # pylint: disable=broad-except
+                if self._stop_event.is_set():
+                    return
+                _LOGGER.warning("Ring event connection failed: %s", err)
+            else:
+                _LOGGER.debug("Ring event connection closed")
+            self._fallback(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    async def _async_run(self):
+        backoff = self.min_backoff
+        while True:
+            try:
+                async for event in self._transport.async_events():
+                    backoff = self.min_backoff
+                    self._dispatch(event)
+            except Exception as err:  # pylint: disable=broad-except
+                _LOGGER.warning("Ring event connection failed: %s", err)
+            else:
+                _LOGGER.debug("Ring event connection closed")
+            await self._async_fallback(backoff)
+            backoff = min(backoff * 2, self.max_backoff)
+
+    def _fallback(self, delay):
+        """Poll the active dings until it is time to reconnect."""
+        reconnect_at = time.monotonic() + delay
+        while not self._stop_event.is_set():
+            remaining = reconnect_at - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.fallback_interval is not None:
+                try:
+                    self._ring.update_dings()
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Polling dings failed: %s", err)
+                else:
+                    self._dispatch_all(self._ring.dings_data)
+                remaining = min(remaining, self.fallback_interval)
+            self._stop_event.wait(remaining)
+
+    async def _async_fallback(self, delay):
+        """Poll the active dings until it is time to reconnect."""
+        reconnect_at = time.monotonic() + delay
+        while True:
+            remaining = reconnect_at - time.monotonic()
+            if remaining <= 0:
+                return
+            if self.fallback_interval is not None:
+                try:
+                    await self._ring.update_dings()
+                except Exception as err:  # pylint: disable=broad-except
+                    _LOGGER.warning("Polling dings failed: %s", err)
+                else:
+                    self._dispatch_all(self._ring.dings_data)
+                remaining = min(remaining, self.fallback_interval)
+            await asyncio.sleep(remaining)
+
+    def _dispatch_all(self, events):
+        for event in events or ():
+            self._dispatch(event)
+
+    def _dispatch(self, event):
+        ding_id = event.get("id")
+        if ding_id in self._seen:
+            return
+        if ding_id is not None:
+            self._seen.add(ding_id)
+            self._seen_order.append(ding_id)
+            if len(self._seen_order) > LISTENER_SEEN_DINGS:
+                self._seen.discard(self._seen_order.popleft())
+            self._ring._add_alert(event)  # pylint:disable=protected-access
+        for callback in list(self._callbacks):
+            try:
+                callback(event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception("Error in ding callback %s", callback)
@@ -0,0 +1,222 @@
+# coding: utf-8
+# vim:sw=4:ts=4:et:
+"""Python Ring background polling."""
+import asyncio
+import logging
+import threading
+import time
+
+from ring_doorbell.const import (
+    DEFAULT_POLL_INTERVALS,
+    DEFAULT_POLL_MIN_INTERVALS,
+    DEFAULT_POLL_MAX_INTERVAL,
+    POLL_ACTIVITY_WINDOW,
+)
+
+_LOGGER = logging.getLogger(__name__)
+
+# data classes in the order they are polled when due at the same time,
+# devices first as groups and health need the device list
+POLLED = ("devices", "dings", "groups", "health")
+
+# factor intervals grow by when returning to idle and after errors
+_BACKOFF_FACTOR = 2
+
+
+class _PollTask:
+    """Schedule of one polled data class."""
+
+    __slots__ = ("name", "interval", "min_interval", "current", "next_run")
+
+    def __init__(self, name, interval, min_interval, next_run):
+        self.name = name
+        self.interval = interval
+        self.min_interval = min(min_interval, interval)
+        self.current = interval
+        self.next_run = next_run
+
+
+class RingPoller:
+    """Keep the data of a Ring object up to date in the background.
+
+    Every data class is polled at its own interval: dings fast, devices
+    slower, groups and health rarely. While there are active dings or
+    devices change the intervals shrink to their minimum, once idle they
+    grow back to their configured value. Failing polls back off up to
+    max_interval.
+
+    Use :meth:`start`/:meth:`stop` to poll a :class:`Ring` from a daemon
+    thread and :meth:`async_start`/:meth:`async_stop` to poll an
+    :class:`AsyncRing` from an asyncio task.
+    """
+
+    def __init__(
+        self,
+        ring,
+        intervals=None,
+        min_intervals=None,
+        max_interval=DEFAULT_POLL_MAX_INTERVAL,
+        activity_window=POLL_ACTIVITY_WINDOW,
+    ):
+        """Initialize the poller.
+
+        :param intervals: seconds between polls per data class while idle,
+            a data class set to None is not polled
+        :param min_intervals: seconds between polls per data class while
+            there is activity
+        :param activity_window: seconds polling stays fast after activity
+        """
+        intervals = {**DEFAULT_POLL_INTERVALS, **(intervals or {})}
+        min_intervals = {**DEFAULT_POLL_MIN_INTERVALS, **(min_intervals or {})}
+        unknown = set(intervals) - set(POLLED)
+        if unknown:
+            raise ValueError("Unknown data classes: {}".format(", ".join(unknown)))
+
+        self._ring = ring
+        self.max_interval = max_interval
+        self.activity_window = activity_window
+        now = time.monotonic()
+        self._tasks = {
+            name: _PollTask(
+                name, intervals[name], min_intervals.get(name, intervals[name]), now
+            )
+            for name in POLLED
+            if intervals.get(name) is not None
+        }
+        self._active_until = 0
+        self._devices_changed = False
+        self._stop_event = threading.Event()
+        self._thread = None
+        self._task = None
+        ring.add_device_listener(self._on_device_changes)
+
+    def interval(self, name):
+        """Return the current interval of a data class in seconds."""
+        return self._tasks[name].current
+
+    def start(self):
+        """Start polling from a daemon thread."""
+        if self._thread is not None:
+            return
+        self._stop_event.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="ring-poller", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self):
+        """Stop the polling thread, waiting for a running poll to finish."""
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join()
+            self._thread = None
+
+    async def async_start(self):
+        """Start polling from an asyncio task."""
+        if self._task is None:
+            self._task = asyncio.ensure_future(self._async_run())
+
+    async def async_stop(self):
+        """Cancel the polling task."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        try:
+            await self._task
+        except asyncio.CancelledError:
+            pass
+        self._task = None
+
+    def run_pending(self):
+        """Poll the data classes which are due.
+
+        :return: seconds until the next poll is due
+        """
+        due = self._due()
+        for task in due:
+            try:
+                self._poll(task.name)
+            except Exception as err:  # pylint: disable=broad-except
+                self._failed(task, err)
+            else:
+                self._succeeded(task)
+        self._expire_alerts(due)
+        return self._next_delay()
+
+    async def async_run_pending(self):
+        """Poll the data classes which are due.
+
+        :return: seconds until the next poll is due
+        """
+        due = self._due()
+        for task in due:
+            try:
+                await self._async_poll(task.name)
+            except Exception as err:  # pylint: disable=broad-except
+                self._failed(task, err)
+            else:
+                self._succeeded(task)
+        self._expire_alerts(due)
+        return self._next_delay()
+
+    def _run(self):
+        while not self._stop_event.is_set():
+            self._stop_event.wait(self.run_pending())
+
+    async def _async_run(self):
+        while True:
+            await asyncio.sleep(await self.async_run_pending())
+
+    def _poll(self, name):
+        getattr(self._ring, "update_" + name)()
+
+    async def _async_poll(self, name):
+        await getattr(self._ring, "update_" + name)()
+
+    def _expire_alerts(self, due):
+        """Notify alert expiry on every dings tick, even when polling failed."""
+        if any(task.name == "dings" for task in due):
+            self._ring.expire_alerts()
+
+    def _due(self):
+        now = time.monotonic()
+        return [task for task in self._tasks.values() if task.next_run <= now]
+
+    def _next_delay(self):
+        if not self._tasks:
+            return self.max_interval
+        next_run = min(task.next_run for task in self._tasks.values())
+        return max(next_run - time.monotonic(), 0)
+
+    def _on_device_changes(self, changes):
+        # pylint:disable=unused-argument
+        self._devices_changed = True
+
+    def _succeeded(self, task):
+        now = time.monotonic()
+        if task.name == "dings" and self._ring.dings_data:
+            self._activity(now)
+        elif task.name == "devices" and self._devices_changed:
+            self._devices_changed = False
+            self._activity(now)
+
+        if now < self._active_until:
+            task.current = task.min_interval
+        else:
+            task.current = min(task.current * _BACKOFF_FACTOR, task.interval)
+        task.next_run = now + task.current
+
+    def _activity(self, now):
+        """Poll every data class at its minimum interval for a while."""
+        if now >= self._active_until:
+            for task in self._tasks.values():
+                task.current = task.min_interval
+                task.next_run = min(task.next_run, now + task.min_interval)
+        self._active_until = now + self.activity_window
+
+    def _failed(self, task, err):
+        task.current = min(task.current * _BACKOFF_FACTOR, self.max_interval)
+        task.next_run = time.monotonic() + task.current
+        _LOGGER.warning(
+            "Polling %s failed, retrying in %ss: %s", task.name, task.current, err
+        )
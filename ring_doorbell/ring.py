@@ -1,15 +1,24 @@
 # vim:sw=4:ts=4:et:
 """Python Ring Doorbell module."""
+import asyncio
+import heapq
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from time import time
+from typing import NamedTuple
 
-from ring_doorbell.auth import Auth
+from ring_doorbell.auth import Auth, AsyncAuth
+from ring_doorbell.changes import diff_devices
 from ring_doorbell.doorbot import RingDoorBell
 from ring_doorbell.chime import RingChime
 from ring_doorbell.stickup_cam import RingStickUpCam
 from ring_doorbell.group import RingLightGroup
 from .const import (
     API_URI,
+    CAPABILITIES,
+    DEFAULT_HEALTH_TTL,
+    DEFAULT_MAX_WORKERS,
     DEVICES_ENDPOINT,
     NEW_SESSION_ENDPOINT,
     DINGS_ENDPOINT,
@@ -35,15 +44,42 @@ TYPES = {
 class Ring(object):
     """A Python Abstraction object to Ring Door Bell."""
 
-    def __init__(self, auth):
-        """Initialize the Ring object."""
+    def __init__(
+        self,
+        auth,
+        max_workers=DEFAULT_MAX_WORKERS,
+        health_ttl=DEFAULT_HEALTH_TTL,
+        cache=None,
+    ):
+        """Initialize the Ring object.
+
+        :param max_workers: maximum number of requests sent concurrently
+        :param health_ttl: seconds update_health keeps device health data
+        :param cache: optional ResponseCache answering repeated GET queries
+        """
         self.auth: Auth = auth
+        self.max_workers = max_workers
+        self.health_ttl = health_ttl
+        self.cache = cache
         self.session = None
         self.devices_data = None
         self.chime_health_data = None
         self.doorbell_health_data = None
         self.dings_data = None
         self.groups_data = None
+        # locations groups_data was last built from
+        self._groups_locations = None
+        # long-lived device objects keyed by device type and id
+        self._devices = {}
+        self._index = _DeviceIndex()
+        # validators and decoded body of the last response of polled urls
+        self._conditional = {}
+        self._device_listeners = []
+        self._alerts = _AlertIndex()
+        self._alert_expired_listeners = []
+        # GET requests in flight keyed by url, params and headers
+        self._flights = {}
+        self._flights_lock = threading.Lock()
 
     def update_data(self):
         """Update all data."""
@@ -53,9 +89,14 @@ class Ring(object):
         if self.session is None:
             self.create_session()
 
-        self.update_devices()
-
-        self.update_dings()
+        # devices and dings are independent, groups need the device locations
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(self.update_devices),
+                executor.submit(self.update_dings),
+            ]
+            for future in futures:
+                future.result()
 
         self.update_groups()
 
@@ -75,50 +116,232 @@ class Ring(object):
         if self.session is None:
             self.create_session()
 
-        data = self._query(DEVICES_ENDPOINT).json()
+        data, changed = self._query_json(DEVICES_ENDPOINT)
+        if changed:
+            self._set_devices_data(data)
 
+    def _set_devices_data(self, data):
+        old_data = self.devices_data
         # Index data by device ID.
         self.devices_data = {
             device_type: {obj["id"]: obj for obj in devices}
             for device_type, devices in data.items()
         }
+        self._prune_devices()
+        self._index = _DeviceIndex(self.get_device_list(), self.devices_data)
+        self._alerts.route(self.get_device_by_id)
+        if self._device_listeners:
+            self._notify_device_changes(diff_devices(old_data, self.devices_data))
+
+    def add_device_listener(self, listener):
+        """Call listener with the device changes found by every update.
+
+        listener receives a list of :class:`DeviceChange` and is only called
+        when something changed, including changes made by the setters.
+        """
+        self._device_listeners.append(listener)
+
+    def remove_device_listener(self, listener):
+        """Stop calling a listener added with add_device_listener."""
+        self._device_listeners.remove(listener)
+
+    def _notify_device_changes(self, changes):
+        if not changes:
+            return
+        for listener in list(self._device_listeners):
+            try:
+                listener(changes)
+            except Exception:  # pylint: disable=broad-except
+                _logger.exception("Error in device listener %s", listener)
+
+    def _prune_devices(self):
+        """Drop the objects of devices which are no longer present.
+
+        Objects of remaining devices are kept so state such as health data
+        survives updates.
+        """
+        for dev_type, device_id in list(self._devices):
+            if device_id not in self.devices_data.get(dev_type, {}):
+                del self._devices[(dev_type, device_id)]
+
+    def _get_device(self, dev_type, device_id):
+        """Return the long-lived object of a device, creating it once."""
+        key = (dev_type, device_id)
+        device = self._devices.get(key)
+        if device is None:
+            device = self._devices[key] = TYPES[dev_type](self, device_id)
+        return device
 
     def update_dings(self):
         """Update dings data."""
         if self.session is None:
             self.create_session()
-        self.dings_data = self._query(DINGS_ENDPOINT).json()
+        self._set_dings_data(*self._query_json(DINGS_ENDPOINT))
+
+    def _set_dings_data(self, data, changed=True):
+        self.dings_data = data
+        now = time()
+        # report the alerts which expired before they are replaced
+        self.expire_alerts(now)
+        if changed:
+            # the index is read under the alert lock, a devices update running
+            # concurrently routes the alerts again once it swapped the index
+            self._alerts.replace(data, self.get_device_by_id, now)
 
     def update_groups(self):
         """Update groups data."""
         if self.session is None:
             self.create_session()
-        # Get all locations
-        locations = set()
-        for devices in self.devices_data.values():
-            for dev in devices.values():
-                if "location_id" in dev:
-                    locations.add(dev["location_id"])
 
         # Query for groups
+        locations = frozenset(self._locations())
+        results = self._map(
+            lambda location: self._query_json(GROUPS_ENDPOINT.format(location)),
+            locations,
+        )
+        self._update_groups_data(locations, results)
+
+    def update_health(self, devices=None, max_workers=None, force=False):
+        """Update the health data of devices concurrently.
+
+        Devices whose health data is younger than health_ttl are skipped
+        unless force is True.
+
+        :param devices: devices to update, all devices by default
+        :param max_workers: maximum number of concurrent requests, defaults
+            to the one of the Ring object
+        """
+        if self.session is None:
+            self.create_session()
+        self._map(
+            lambda device: device.update_health_data(),
+            self._stale_health(devices, force),
+            max_workers,
+        )
+
+    def _stale_health(self, devices, force):
+        if devices is None:
+            devices = self.get_device_list()
+        if force:
+            return list(devices)
+        # pylint:disable=protected-access
+        return [
+            device for device in devices if device._health_is_stale(self.health_ttl)
+        ]
+
+    def _map(self, func, items, max_workers=None):
+        """Call func for every item using at most max_workers threads.
+
+        Results are returned in the order of items.
+        """
+        items = list(items)
+        if max_workers is None:
+            max_workers = self.max_workers
+        if len(items) <= 1 or max_workers <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _query_json(self, url):
+        """GET a polled url and return its decoded body.
+
+        The ETag and Last-Modified validators of the last response are sent
+        back and the body decoded then is reused when the API answers 304.
+
+        :return: the decoded body and whether it changed
+        """
+        cached = self._conditional.get(url)
+        response = self._query(
+            url, extra_headers=cached.headers if cached is not None else None
+        )
+        if response.status_code == 304 and cached is not None:
+            return cached.data, False
+        data = response.json()
+        self._remember_response(url, response.headers, data)
+        return data, True
+
+    def _forget_response(self, url):
+        """Fetch url in full next time, e.g. after its data was changed locally."""
+        self._conditional.pop(url, None)
+
+    def _remember_response(self, url, headers, data):
+        validators = _conditional_headers(headers)
+        if validators:
+            self._conditional[url] = _ConditionalResponse(validators, data)
+        else:
+            self._conditional.pop(url, None)
+
+    def _locations(self):
+        """Return the location ids of all devices."""
+        return self._index.location_ids
+
+    def _update_groups_data(self, locations, results):
+        """Rebuild groups_data when a location changed, appeared or left."""
+        if (
+            self.groups_data is None
+            or locations != self._groups_locations
+            or any(changed for _, changed in results)
+        ):
+            self._set_groups_data(data for data, _ in results)
+            self._groups_locations = locations
+
+    def _set_groups_data(self, responses):
         self.groups_data = {}
-        locations.discard(None)
-        for location in locations:
-            data = self._query(GROUPS_ENDPOINT.format(location)).json()
+        for data in responses:
             if data["device_groups"] is not None:
                 for group in data["device_groups"]:
                     self.groups_data[group["device_group_id"]] = group
 
     def query(
-        self, url, method="GET", extra_params=None, data=None, json=None, timeout=None
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
     ):
-        """Query data from Ring API."""
+        """Query data from Ring API.
+
+        When stream is True the body is not read, the caller is responsible
+        for consuming and closing the response.
+        """
         if self.session is None:
             self.create_session()
-        return self._query(url, method, extra_params, data, json, timeout)
+        cacheable = self._cacheable(method, stream, extra_headers)
+        if cacheable:
+            response = self.cache.get(url, extra_params)
+            if response is not None:
+                return response
+        response = self._query(
+            url, method, extra_params, data, json, timeout, stream, extra_headers
+        )
+        if cacheable:
+            self.cache.set(url, extra_params, response, len(response.content))
+        elif self.cache is not None and method != "GET":
+            self.cache.invalidate(url)
+        return response
+
+    def _cacheable(self, method, stream, extra_headers):
+        return (
+            self.cache is not None
+            and method == "GET"
+            and not stream
+            and extra_headers is None
+        )
 
     def _query(
-        self, url, method="GET", extra_params=None, data=None, json=None, timeout=None
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
     ):
         _logger.debug(
             "url: %s\nmethod: %s\njson: %s\ndata: %s\n extra_params: %s",
@@ -128,25 +351,64 @@ class Ring(object):
             data,
             extra_params,
         )
-        response = self.auth.query(
-            API_URI + url,
-            method=method,
-            extra_params=extra_params,
-            data=data,
-            json=json,
-            timeout=timeout,
-        )
-        _logger.debug("response_text %s", response.text)
+
+        def _send():
+            return self.auth.query(
+                API_URI + url,
+                method=method,
+                extra_params=extra_params,
+                data=data,
+                json=json,
+                timeout=timeout,
+                stream=stream,
+                extra_headers=extra_headers,
+            )
+
+        key = _flight_key(url, method, extra_params, extra_headers, stream)
+        response = _send() if key is None else self._single_flight(key, _send)
+        if _logger.isEnabledFor(logging.DEBUG):
+            content_type = response.headers.get("Content-Type", "")
+            if not stream and _is_text(content_type):
+                _logger.debug("response_text %s", response.text)
+            else:
+                _logger.debug("response_content_type %s", content_type)
         return response
 
+    def _single_flight(self, key, send):
+        """Share the response of send between concurrent identical calls.
+
+        The first caller sends the request, callers arriving while it is in
+        flight wait for it and get the same response or exception.
+        """
+        with self._flights_lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+        if not leader:
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return flight.response
+        try:
+            flight.response = send()
+            return flight.response
+        except BaseException as err:
+            flight.error = err
+            raise
+        finally:
+            with self._flights_lock:
+                del self._flights[key]
+            flight.done.set()
+
     def devices(self):
         """Get all devices."""
         devices = {}
 
-        for dev_type, convertor in TYPES.items():
+        for dev_type in TYPES:
             devices[dev_type] = [
-                convertor(self, obj["id"])
-                for obj in self.devices_data.get(dev_type, {}).values()
+                self._get_device(dev_type, device_id)
+                for device_id in self.devices_data.get(dev_type, {})
             ]
 
         return devices
@@ -163,14 +425,23 @@ class Ring(object):
 
     def get_device_by_name(self, device_name):
         """Return a device using it's name."""
-        all_devices = self.get_device_list()
-        names_to_idx = {device.name: idx for (idx, device) in enumerate(all_devices)}
-        device = (
-            None
-            if device_name not in names_to_idx
-            else all_devices[names_to_idx[device_name]]
-        )
-        return device
+        return self._index.by_name.get(device_name)
+
+    def get_device_by_id(self, device_id):
+        """Return a device using its account id."""
+        return self._index.by_id.get(device_id)
+
+    def get_device_by_device_id(self, device_id):
+        """Return a device using its device_id."""
+        return self._index.by_device_id.get(device_id)
+
+    def get_devices_by_location(self, location_id):
+        """Return the devices at a location."""
+        return list(self._index.by_location_id.get(location_id, ()))
+
+    def get_devices_by_capability(self, capability):
+        """Return the devices having a capability."""
+        return list(self._index.by_capability.get(capability, ()))
 
     def video_devices(self):
         """Get all devices."""
@@ -193,11 +464,420 @@ class Ring(object):
 
     def active_alerts(self):
         """Get active alerts."""
-        alerts = []
-        for alert in self.dings_data:
-            expires_at = alert.get("now") + alert.get("expires_in")
+        self.expire_alerts()
+        return self._alerts.active()
+
+    def expire_alerts(self, now=None):
+        """Drop the expired alerts and notify the expiry listeners.
+
+        Active alerts are also routed to the ``alert`` and
+        ``alert_expires_at`` attributes of their device, which are cleared
+        here once expired. Returns immediately when nothing expired. Called
+        by every dings update, so listeners fire even when nothing else
+        reads the alerts.
+
+        :param now: timestamp to expire at, the current time by default
+        """
+        if now is None:
+            now = time()
+        for alert in self._alerts.expire(now):
+            for listener in list(self._alert_expired_listeners):
+                try:
+                    listener(alert)
+                except Exception:  # pylint: disable=broad-except
+                    _logger.exception("Error in alert listener %s", listener)
+
+    def add_alert_expired_listener(self, listener):
+        """Call listener with every alert once it expired."""
+        self._alert_expired_listeners.append(listener)
+
+    def remove_alert_expired_listener(self, listener):
+        """Stop calling a listener added with add_alert_expired_listener."""
+        self._alert_expired_listeners.remove(listener)
+
+    def _add_alert(self, alert):
+        """Index an alert received outside of update_dings."""
+        self._alerts.add(alert, self.get_device_by_id, time())
+
+
+class _DeviceIndex:
+    """Lookup tables of the devices, built once per devices update."""
+
+    def __init__(self, devices=(), devices_data=None):
+        self.by_name = {}
+        self.by_id = {}
+        self.by_device_id = {}
+        self.by_location_id = {}
+        self.by_capability = {capability: [] for capability in CAPABILITIES}
+
+        for device in devices:
+            attrs = device._attrs  # pylint:disable=protected-access
+            self.by_name[attrs["description"]] = device
+            self.by_id[device.id] = device
+            if attrs.get("device_id"):
+                self.by_device_id[attrs["device_id"]] = device
+            for capability, capable in self.by_capability.items():
+                if device.has_capability(capability):
+                    capable.append(device)
+            if attrs.get("location_id") is not None:
+                self.by_location_id.setdefault(attrs["location_id"], []).append(device)
+
+        # locations of every device returned, even of unsupported types
+        self.location_ids = {
+            attrs.get("location_id")
+            for data in (devices_data or {}).values()
+            for attrs in data.values()
+        }
+        self.location_ids.discard(None)
+
+
+class _AlertIndex:
+    """Active alerts ordered by expiry and routed to their devices."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        # alert key to alert and expiry, in arrival order
+        self._alerts = {}
+        # heap of expiry and alert key, entries of replaced alerts are stale
+        self._heap = []
+        self._devices = {}
+
+    def replace(self, alerts, lookup, now):
+        """Index alerts instead of the current ones."""
+        with self._lock:
+            self._clear_devices()
+            self._alerts = {}
+            self._heap = []
+            self._devices = {}
+            for alert in alerts or ():
+                self._add(alert, lookup, now)
+
+    def add(self, alert, lookup, now):
+        """Index an alert next to the current ones."""
+        with self._lock:
+            self._add(alert, lookup, now)
+
+    def route(self, lookup):
+        """Route the alerts to the devices returned by lookup."""
+        with self._lock:
+            self._clear_devices()
+            self._devices = {}
+            for key, (alert, expires_at) in self._alerts.items():
+                self._route(key, alert, expires_at, lookup)
+
+    def expire(self, now):
+        """Drop the alerts expired at now and return them."""
+        expired = []
+        with self._lock:
+            while self._heap and self._heap[0][0] <= now:
+                expires_at, key = heapq.heappop(self._heap)
+                entry = self._alerts.get(key)
+                if entry is None or entry[1] != expires_at:
+                    continue
+                del self._alerts[key]
+                device = self._devices.pop(key, None)
+                if device is not None and device.alert is entry[0]:
+                    device.alert = None
+                    device.alert_expires_at = None
+                expired.append(entry[0])
+        return expired
+
+    def active(self):
+        """Return the indexed alerts in arrival order."""
+        with self._lock:
+            return [alert for alert, _ in self._alerts.values()]
+
+    def _add(self, alert, lookup, now):
+        expires_at = alert.get("now", now) + alert.get("expires_in", 0)
+        if expires_at <= now:
+            return
+        key = alert.get("id", id(alert))
+        self._alerts[key] = (alert, expires_at)
+        heapq.heappush(self._heap, (expires_at, key))
+        self._route(key, alert, expires_at, lookup)
+
+    def _route(self, key, alert, expires_at, lookup):
+        device = lookup(alert.get("doorbot_id"))
+        if device is None:
+            return
+        self._devices[key] = device
+        # the alert expiring last is kept, earlier ones expire before it
+        if device.alert_expires_at is None or expires_at >= device.alert_expires_at:
+            device.alert = alert
+            device.alert_expires_at = expires_at
+
+    def _clear_devices(self):
+        for device in self._devices.values():
+            device.alert = None
+            device.alert_expires_at = None
+
+
+# pylint: disable=invalid-overridden-method
+class AsyncRing(Ring):
+    """An asyncio Python Abstraction object to Ring Door Bell.
+
+    Exposes the same surface as :class:`Ring` with the network bound methods
+    as coroutines. Devices returned by it provide ``async_`` prefixed
+    counterparts of their network bound methods and setters.
+    """
+
+    def __init__(
+        self,
+        auth,
+        max_workers=DEFAULT_MAX_WORKERS,
+        health_ttl=DEFAULT_HEALTH_TTL,
+        cache=None,
+    ):
+        """Initialize the AsyncRing object."""
+        super().__init__(auth, max_workers, health_ttl, cache)
+        self.auth: AsyncAuth = auth
+
+    async def update_data(self):
+        """Update all data."""
+        await self._update_data()
+
+    async def _update_data(self):
+        if self.session is None:
+            await self.create_session()
+
+        await asyncio.gather(self.update_devices(), self.update_dings())
+
+        await self.update_groups()
+
+    async def create_session(self):
+        """Create a new Ring session."""
+        session_post_data = POST_DATA
+        session_post_data["device[hardware_id]"] = self.auth.get_hardware_id()
+
+        response = await self._query(
+            NEW_SESSION_ENDPOINT,
+            method="POST",
+            data=session_post_data,
+        )
+        self.session = await response.json()
+
+    async def update_devices(self):
+        """Update device data."""
+        if self.session is None:
+            await self.create_session()
+
+        data, changed = await self._query_json(DEVICES_ENDPOINT)
+        if changed:
+            self._set_devices_data(data)
+
+    async def update_dings(self):
+        """Update dings data."""
+        if self.session is None:
+            await self.create_session()
+        self._set_dings_data(*(await self._query_json(DINGS_ENDPOINT)))
+
+    async def update_groups(self):
+        """Update groups data."""
+        if self.session is None:
+            await self.create_session()
+
+        async def _query_location(location):
+            return await self._query_json(GROUPS_ENDPOINT.format(location))
+
+        # Query for groups
+        locations = frozenset(self._locations())
+        results = await self._map(_query_location, locations)
+        self._update_groups_data(locations, results)
+
+    async def update_health(self, devices=None, max_workers=None, force=False):
+        """Update the health data of devices concurrently.
+
+        See :meth:`Ring.update_health`.
+        """
+        if self.session is None:
+            await self.create_session()
+        await self._map(
+            lambda device: device.async_update_health_data(),
+            self._stale_health(devices, force),
+            max_workers,
+        )
+
+    async def _map(self, func, items, max_workers=None):
+        """Await func for every item with at most max_workers in flight.
+
+        Results are returned in the order of items.
+        """
+        if max_workers is None:
+            max_workers = self.max_workers
+        semaphore = asyncio.Semaphore(max(max_workers, 1))
+
+        async def _bounded(item):
+            async with semaphore:
+                return await func(item)
+
+        return await asyncio.gather(*(_bounded(item) for item in items))
+
+    async def _async_single_flight(self, key, send):
+        """Share the response of the send coroutine function between calls.
+
+        See :meth:`Ring._single_flight`. When the calling task that sends
+        the request is cancelled, a waiting caller sends it again instead of
+        being cancelled with it.
+        """
+        while True:
+            future = self._flights.get(key)
+            if future is None:
+                break
+            try:
+                return await asyncio.shield(future)
+            except asyncio.CancelledError:
+                if not future.cancelled():
+                    # this caller was cancelled, not the one sending
+                    raise
+        future = self._flights[key] = asyncio.get_running_loop().create_future()
+        try:
+            response = await send()
+        except asyncio.CancelledError:
+            future.cancel()
+            raise
+        except BaseException as err:
+            future.set_exception(err)
+            # retrieve the exception so it is not reported when unshared
+            future.exception()
+            raise
+        else:
+            future.set_result(response)
+            return response
+        finally:
+            del self._flights[key]
+
+    async def _query_json(self, url):
+        """GET a polled url and return its decoded body.
+
+        See :meth:`Ring._query_json`.
+        """
+        cached = self._conditional.get(url)
+        response = await self._query(
+            url, extra_headers=cached.headers if cached is not None else None
+        )
+        if response.status == 304 and cached is not None:
+            return cached.data, False
+        data = await response.json()
+        self._remember_response(url, response.headers, data)
+        return data, True
+
+    async def query(
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
+    ):
+        """Query data from Ring API.
+
+        When stream is True the body is not read, the caller is responsible
+        for consuming and releasing the response.
+        """
+        if self.session is None:
+            await self.create_session()
+        cacheable = self._cacheable(method, stream, extra_headers)
+        if cacheable:
+            response = self.cache.get(url, extra_params)
+            if response is not None:
+                return response
+        response = await self._query(
+            url, method, extra_params, data, json, timeout, stream, extra_headers
+        )
+        if cacheable:
+            self.cache.set(url, extra_params, response, len(await response.read()))
+        elif self.cache is not None and method != "GET":
+            self.cache.invalidate(url)
+        return response
+
+    async def _query(
+        self,
+        url,
+        method="GET",
+        extra_params=None,
+        data=None,
+        json=None,
+        timeout=None,
+        stream=False,
+        extra_headers=None,
+    ):
+        _logger.debug(
+            "url: %s\nmethod: %s\njson: %s\ndata: %s\n extra_params: %s",
+            url,
+            method,
+            json,
+            data,
+            extra_params,
+        )
+
+        def _send():
+            return self.auth.query(
+                API_URI + url,
+                method=method,
+                extra_params=extra_params,
+                data=data,
+                json=json,
+                timeout=timeout,
+                stream=stream,
+                extra_headers=extra_headers,
+            )
+
+        key = _flight_key(url, method, extra_params, extra_headers, stream)
+        if key is None:
+            response = await _send()
+        else:
+            response = await self._async_single_flight(key, _send)
+        if _logger.isEnabledFor(logging.DEBUG):
+            content_type = response.headers.get("Content-Type", "")
+            if not stream and _is_text(content_type):
+                _logger.debug("response_text %s", await response.text())
+            else:
+                _logger.debug("response_content_type %s", content_type)
+        return response
+
+
+class _ConditionalResponse(NamedTuple):
+    """Request headers revalidating a response and its decoded body."""
+
+    headers: dict
+    data: object
+
+
+def _conditional_headers(headers):
+    """Return the conditional request headers matching response headers."""
+    validators = {}
+    if headers.get("ETag"):
+        validators["If-None-Match"] = headers["ETag"]
+    if headers.get("Last-Modified"):
+        validators["If-Modified-Since"] = headers["Last-Modified"]
+    return validators
+
+
+class _Flight:
+    """A request in flight shared by identical concurrent calls."""
+
+    __slots__ = ("done", "response", "error")
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.response = None
+        self.error = None
+
+
+def _flight_key(url, method, extra_params, extra_headers, stream):
+    """Return the key identifying a request, None if it cannot be shared."""
+    if method != "GET" or stream:
+        return None
+    return (
+        url,
+        tuple(sorted((extra_params or {}).items())),
+        tuple(sorted((extra_headers or {}).items())),
+    )
 
-            if time() < expires_at:
-                alerts.append(alert)
 
-        return alerts
+def _is_text(content_type):
+    """Return if a response body is worth decoding for the debug log."""
+    return content_type.startswith("text/") or "json" in content_type
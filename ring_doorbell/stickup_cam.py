@@ -4,18 +4,12 @@
 import logging
 
 from ring_doorbell.doorbot import RingDoorBell
+from ring_doorbell.generic import SettingsRequest
 from ring_doorbell.const import (
     LIGHTS_ENDPOINT,
     MSG_ALLOWED_VALUES,
     MSG_VOL_OUTBOUND,
-    FLOODLIGHT_CAM_KINDS,
-    FLOODLIGHT_CAM_PRO_KINDS,
-    INDOOR_CAM_KINDS,
-    SPOTLIGHT_CAM_BATTERY_KINDS,
-    SPOTLIGHT_CAM_WIRED_KINDS,
-    STICKUP_CAM_KINDS,
-    STICKUP_CAM_BATTERY_KINDS,
-    STICKUP_CAM_WIRED_KINDS,
+    SPOTLIGHT_CAM_KINDS,
     SIREN_DURATION_MIN,
     SIREN_DURATION_MAX,
     SIREN_ENDPOINT,
@@ -28,6 +22,11 @@ _LOGGER = logging.getLogger(__name__)
 class RingStickUpCam(RingDoorBell):
     """Implementation for RingStickUpCam."""
 
+    _family_capabilities = frozenset()
+    _kind_capabilities = frozenset(
+        ["battery", "light", "motion_detection", "siren", "video"]
+    )
+
     @property
     def family(self):
         """Return Ring device family type."""
@@ -35,74 +34,17 @@ class RingStickUpCam(RingDoorBell):
 
     def update_health_data(self):
         """Update health attrs."""
-        self._health_attrs = (
-            self._ring.query(HEALTH_DOORBELL_ENDPOINT.format(self.id))
-            .json()
-            .get("device_health", {})
+        self._set_health_data(
+            self._ring.query(HEALTH_DOORBELL_ENDPOINT.format(self.id)).json()
         )
 
     @property
     def model(self):
         """Return Ring device model name."""
-        if self.kind in FLOODLIGHT_CAM_KINDS:
-            return "Floodlight Cam"
-        if self.kind in FLOODLIGHT_CAM_PRO_KINDS:
-            return "Floodlight Cam Pro"
-        if self.kind in INDOOR_CAM_KINDS:
-            return "Indoor Cam"
-        if self.kind in SPOTLIGHT_CAM_BATTERY_KINDS:
-            return "Spotlight Cam {}".format(
-                self._attrs.get("ring_cam_setup_flow", "battery").title()
-            )
-        if self.kind in SPOTLIGHT_CAM_WIRED_KINDS:
-            return "Spotlight Cam {}".format(
-                self._attrs.get("ring_cam_setup_flow", "wired").title()
-            )
-        if self.kind in STICKUP_CAM_KINDS:
-            return "Stick Up Cam"
-        if self.kind in STICKUP_CAM_BATTERY_KINDS:
-            return "Stick Up Cam Battery"
-        if self.kind in STICKUP_CAM_WIRED_KINDS:
-            return "Stick Up Cam Wired"
-        _LOGGER.error("Unknown kind: %s", self.kind)
-        return None
-
-    def has_capability(self, capability):
-        """Return if device has specific capability."""
-        if capability == "battery":
-            return self.kind in (
-                SPOTLIGHT_CAM_BATTERY_KINDS
-                + STICKUP_CAM_KINDS
-                + STICKUP_CAM_BATTERY_KINDS
-            )
-        if capability == "light":
-            return self.kind in (
-                FLOODLIGHT_CAM_KINDS
-                + FLOODLIGHT_CAM_PRO_KINDS
-                + SPOTLIGHT_CAM_BATTERY_KINDS
-                + SPOTLIGHT_CAM_WIRED_KINDS
-            )
-        if capability == "siren":
-            return self.kind in (
-                FLOODLIGHT_CAM_KINDS
-                + FLOODLIGHT_CAM_PRO_KINDS
-                + INDOOR_CAM_KINDS
-                + SPOTLIGHT_CAM_BATTERY_KINDS
-                + SPOTLIGHT_CAM_WIRED_KINDS
-                + STICKUP_CAM_BATTERY_KINDS
-                + STICKUP_CAM_WIRED_KINDS
-            )
-        if capability in ("motion_detection", "video"):
-            return self.kind in (
-                FLOODLIGHT_CAM_KINDS
-                + FLOODLIGHT_CAM_PRO_KINDS
-                + INDOOR_CAM_KINDS
-                + SPOTLIGHT_CAM_BATTERY_KINDS
-                + SPOTLIGHT_CAM_WIRED_KINDS
-                + STICKUP_CAM_BATTERY_KINDS
-                + STICKUP_CAM_WIRED_KINDS
-            )
-        return False
+        setup_flow = self._attrs.get("ring_cam_setup_flow")
+        if setup_flow and self.kind in SPOTLIGHT_CAM_KINDS:
+            return "Spotlight Cam {}".format(setup_flow.title())
+        return super().model
 
     @property
     def lights(self):
@@ -112,15 +54,31 @@ class RingStickUpCam(RingDoorBell):
     @lights.setter
     def lights(self, state):
         """Control the lights."""
+        request = self._lights_request(state)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_lights(self, state):
+        """Control the lights."""
+        request = self._lights_request(state)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _lights_request(self, state):
         values = ["on", "off"]
         if state not in values:
             _LOGGER.error("%s", MSG_ALLOWED_VALUES.format(", ".join(values)))
-            return False
+            return None
 
-        url = LIGHTS_ENDPOINT.format(self.id, state)
-        self._ring.query(url, method="PUT")
-        self._ring.update_devices()
-        return True
+        return SettingsRequest(
+            LIGHTS_ENDPOINT.format(self.id, state),
+            attrs={"led_status": state},
+            key="lights",
+        )
 
     @property
     def siren(self):
@@ -132,6 +90,21 @@ class RingStickUpCam(RingDoorBell):
     @siren.setter
     def siren(self, duration):
         """Control the siren."""
+        request = self._siren_request(duration)
+        if request is None:
+            return False
+        self._send_settings(request)
+        return True
+
+    async def async_set_siren(self, duration):
+        """Control the siren."""
+        request = self._siren_request(duration)
+        if request is None:
+            return False
+        await self._async_send_settings(request)
+        return True
+
+    def _siren_request(self, duration):
         if not (
             (isinstance(duration, int))
             and (SIREN_DURATION_MIN <= duration <= SIREN_DURATION_MAX)
@@ -139,7 +112,7 @@ class RingStickUpCam(RingDoorBell):
             _LOGGER.error(
                 "%s", MSG_VOL_OUTBOUND.format(SIREN_DURATION_MIN, SIREN_DURATION_MAX)
             )
-            return False
+            return None
 
         if duration > 0:
             state = "on"
@@ -147,7 +120,9 @@ class RingStickUpCam(RingDoorBell):
         else:
             state = "off"
             params = {}
-        url = SIREN_ENDPOINT.format(self.id, state)
-        self._ring.query(url, extra_params=params, method="PUT")
-        self._ring.update_devices()
-        return True
+        return SettingsRequest(
+            SIREN_ENDPOINT.format(self.id, state),
+            extra_params=params,
+            attrs={"siren_status": {"seconds_remaining": duration}},
+            key="siren",
+        )
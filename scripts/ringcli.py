@@ -142,11 +142,7 @@ def cli():
     doorbell = ""
 
     if args.device_id:
-        for key in devices:
-            devices_by_kind = devices[key]
-            for device in devices_by_kind:
-                if (device.device_id == args.device_id):
-                    doorbell = device
+        doorbell = ring.get_device_by_device_id(args.device_id) or ""
     else:
         for key in devices:
             devices_by_kind = devices[key]
@@ -165,15 +161,8 @@ def cli():
             + "\tThis may take some time....\n"
         )
 
-        events = []
-        counter = 0
-        history = doorbell.history(limit=batch_size)
-        while len(history) > 0:
-            events += history
-            counter += len(history)
-            last_event_id = history[-1]["id"]
-            history = doorbell.history(limit=batch_size, older_than=last_event_id)
-            history = [event for event in history if event["id"] != last_event_id]
+        events = list(doorbell.iter_history(page_size=batch_size))
+        counter = len(events)
 
         motion = len([m["kind"] for m in events if m["kind"] == "motion"])
         ding = len([m["kind"] for m in events if m["kind"] == "ding"])
@@ -189,37 +178,25 @@ def cli():
             "\tDownloading all videos linked on your Ring account.\n"
             + "\tThis may take some time....\n"
         )
-        history = doorbell.history(limit=batch_size)
         counter = 0
         download_counter = 0
 
-        while len(history) > 0:
-            print(
-                "\tProcessing and downloading the next "
-                + format(len(history))
-                + " videos"
-            )
-
-            for event in history:
-                counter += 1
-                filename = _format_filename(doorbell, event, args.directory)
-                filepath = Path(filename)
-                if not filepath.is_file():
-                    download_counter +=1
-                    print("\t{}/{} Downloading {}".format(counter, len(history), filename))
-
-                    try:
-                        doorbell.recording_download(
-                            event["id"], filename=filename, override=False
-                        )
-                        right_date = datetime.timestamp(event["created_at"])
-                        os.utime(filename, (right_date, right_date))
-                    except:
-                        print("\t{}/{} Error {}".format(counter, len(history), filename))
-
-            last_event_id = history[-1]["id"]
-            history = doorbell.history(limit=batch_size, older_than=last_event_id)
-            history = [event for event in history if event["id"] != last_event_id]
+        for event in doorbell.iter_history(page_size=batch_size):
+            counter += 1
+            filename = _format_filename(doorbell, event, args.directory)
+            filepath = Path(filename)
+            if not filepath.is_file():
+                download_counter +=1
+                print("\t{} Downloading {}".format(counter, filename))
+
+                try:
+                    doorbell.recording_download(
+                        event["id"], filename=filename, override=False
+                    )
+                    right_date = datetime.timestamp(event["created_at"])
+                    os.utime(filename, (right_date, right_date))
+                except:
+                    print("\t{} Error {}".format(counter, filename))
 
         print("Downloaded videos: ", download_counter)
         print("Total videos: ", counter)
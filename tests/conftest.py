@@ -3,8 +3,9 @@ import pytest
 import re
 from tests.helpers import load_fixture
 import requests_mock
+from aioresponses import aioresponses
 
-from ring_doorbell import Ring, Auth
+from ring_doorbell import Ring, Auth, AsyncRing, AsyncAuth
 from ring_doorbell.const import USER_AGENT
 
 
@@ -18,6 +19,81 @@ def ring(requests_mock):
     return ring
 
 
+@pytest.fixture
+async def async_ring(aioresponses_mock):
+    """Return an asyncio ring object."""
+    auth = AsyncAuth(USER_AGENT)
+    await auth.fetch_token("foo", "bar")
+    ring = AsyncRing(auth)
+    await ring.update_data()
+    yield ring
+    await auth.close()
+
+
+@pytest.fixture(name="aioresponses_mock")
+def aioresponses_mock_fixture():
+    def _api(path):
+        return re.compile(r"^https:\/\/api\.ring\.com" + path + r"(\?.*)?$")
+
+    with aioresponses() as mock:
+        mock.post(
+            "https://oauth.ring.com/oauth/token",
+            body=load_fixture("ring_oauth.json"),
+            repeat=True,
+        )
+        mock.post(
+            _api(r"\/clients_api\/session"),
+            body=load_fixture("ring_session.json"),
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/ring_devices"),
+            body=load_fixture("ring_devices.json"),
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/chimes\/\d+\/health"),
+            body=load_fixture("ring_chime_health_attrs.json"),
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/doorbots\/\d+\/health"),
+            body=load_fixture("ring_doorboot_health_attrs.json"),
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/doorbots\/987652\/history"),
+            body=load_fixture("ring_doorbots.json"),
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/dings\/active"),
+            body=load_fixture("ring_ding_active.json"),
+            repeat=True,
+        )
+        mock.put(
+            _api(r"\/clients_api\/doorbots\/987652\/(floodlight_light|siren)_(on|off)"),
+            body="ok",
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/groups\/v1\/locations\/mock-location-id\/groups"),
+            body=load_fixture("ring_groups.json"),
+            repeat=True,
+        )
+        mock.patch(
+            _api(r"\/devices\/v1\/devices\/\d+\/settings"),
+            body="ok",
+            repeat=True,
+        )
+        mock.get(
+            _api(r"\/clients_api\/dings\/987654321\/recording"),
+            body=b"123456",
+            repeat=True,
+        )
+        yield mock
+
+
 # setting the fixture name to requests_mock allows other
 # tests to pull in request_mock and append uris
 @pytest.fixture(autouse=True, name="requests_mock")
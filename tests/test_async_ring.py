@@ -0,0 +1,190 @@
+"""The tests for the asyncio Ring platform."""
+import asyncio
+import io
+import json
+import re
+import time
+
+import aiohttp
+import pytest
+
+from ring_doorbell import AsyncAuth, AsyncRing
+from tests.helpers import load_fixture
+
+
+async def test_async_basic_attributes(async_ring):
+    """Test the AsyncRing class and methods."""
+    assert isinstance(async_ring, AsyncRing)
+    data = async_ring.devices()
+    assert len(data["chimes"]) == 1
+    assert len(data["doorbots"]) == 1
+    assert len(data["authorized_doorbots"]) == 1
+    assert len(data["stickup_cams"]) == 1
+    assert len(async_ring.dings_data) == 3
+    assert "mock-group-id" in async_ring.groups_data
+
+
+async def test_async_doorbell(async_ring):
+    dev = async_ring.devices()["doorbots"][0]
+
+    history = await dev.async_history(limit=1, kind="motion")
+    assert history[0]["id"] == 987654321
+    assert len(await dev.async_history(limit=1, kind="ding")) == 0
+
+    assert await dev.async_recording_download(987654321) == b"123456"
+
+    await dev.async_update_health_data()
+    assert dev.wifi_name == "ring_mock_wifi"
+    assert dev.wifi_signal_strength == -58
+
+
+async def test_async_update_health(async_ring):
+    await async_ring.update_health()
+    for dev in async_ring.get_device_list():
+        assert dev.wifi_name == "ring_mock_wifi"
+
+
+async def test_async_stickup_cam_controls(async_ring, aioresponses_mock):
+    dev = async_ring.devices()["stickup_cams"][0]
+
+    assert await dev.async_set_lights("on") is True
+    assert await dev.async_set_siren(30) is True
+    assert await dev.async_set_lights("invalid") is False
+
+    puts = [
+        (url.path, dict(url.query))
+        for (method, url) in aioresponses_mock.requests
+        if method == "PUT"
+    ]
+    assert puts[0][0] == "/clients_api/doorbots/987652/floodlight_light_on"
+    assert puts[1][0] == "/clients_api/doorbots/987652/siren_on"
+    assert puts[1][1]["duration"] == "30"
+
+
+async def test_async_settings_batch(async_ring, aioresponses_mock):
+    dev = async_ring.devices()["stickup_cams"][0]
+
+    async with dev.batch():
+        assert await dev.async_set_lights("on") is True
+        assert await dev.async_set_siren(30) is True
+        assert await dev.async_set_lights("off") is True
+
+    puts = [url.path for (method, url) in aioresponses_mock.requests if method == "PUT"]
+    assert puts == [
+        "/clients_api/doorbots/987652/siren_on",
+        "/clients_api/doorbots/987652/floodlight_light_off",
+    ]
+    assert dev.lights == "off"
+
+
+async def test_async_token_refresh(async_ring, aioresponses_mock):
+    # force the current token to be expired
+    async_ring.auth._client._expires_at = 1
+
+    await async_ring.update_dings()
+
+    token_posts = [
+        call
+        for (method, url), calls in aioresponses_mock.requests.items()
+        if method == "POST" and url.host == "oauth.ring.com"
+        for call in calls
+    ]
+    assert len(token_posts) == 2
+    assert "grant_type=refresh_token" in token_posts[1].kwargs["data"]
+
+
+async def test_async_recording_download_streams(async_ring):
+    dev = async_ring.devices()["doorbots"][0]
+
+    fileobj = io.BytesIO()
+    assert await dev.async_recording_download(987654321, filename=fileobj) is True
+    assert fileobj.getvalue() == b"123456"
+
+    chunks = [chunk async for chunk in dev.async_recording_stream(987654321)]
+    assert b"".join(chunks) == b"123456"
+
+
+async def test_async_concurrent_gets_are_coalesced(async_ring):
+    calls = []
+
+    async def _send():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        return "response"
+
+    key = ("/clients_api/dings/active", (), ())
+    results = await asyncio.gather(
+        *(async_ring._async_single_flight(key, _send) for _ in range(5))
+    )
+    assert results == ["response"] * 5
+    assert len(calls) == 1
+    assert not async_ring._flights
+
+    # cancelling the sending task does not cancel the waiting ones
+    tasks = [
+        asyncio.ensure_future(async_ring._async_single_flight(key, _send))
+        for _ in range(3)
+    ]
+    await asyncio.sleep(0.01)
+    tasks[0].cancel()
+    results = await asyncio.gather(*tasks, return_exceptions=True)
+    assert isinstance(results[0], asyncio.CancelledError)
+    assert results[1:] == ["response"] * 2
+    assert len(calls) == 3
+    assert not async_ring._flights
+
+
+async def test_async_concurrent_token_refresh(async_ring, aioresponses_mock):
+    updates = []
+    async_ring.auth.token_updater = updates.append
+    async_ring.auth._client._expires_at = 1
+
+    await asyncio.gather(
+        async_ring.query("/clients_api/ring_devices"),
+        async_ring.query("/clients_api/dings/active"),
+        async_ring.query("/clients_api/doorbots/987652/health"),
+    )
+    assert len(updates) == 1
+
+
+async def test_async_proactive_token_refresh(aioresponses_mock):
+    updates = []
+    token = json.loads(load_fixture("ring_oauth.json"))
+    token["expires_at"] = time.time() + 60
+    auth = AsyncAuth(
+        "test",
+        token=token,
+        token_updater=updates.append,
+        auto_refresh=True,
+        refresh_margin=60,
+    )
+    # scheduled once used from the event loop
+    await auth.query("https://api.ring.com/clients_api/dings/active")
+    for _ in range(100):
+        if updates:
+            break
+        await asyncio.sleep(0.01)
+
+    assert len(updates) == 1
+    assert auth.expires_at > time.time() + 3000
+    await auth.close()
+    assert auth._refresh_task is None
+
+
+async def test_async_transport_retries(aioresponses_mock):
+    url = "https://api.ring.com/clients_api/test_retry"
+    pattern = re.compile(r"^https:\/\/api\.ring\.com\/clients_api\/test_retry\?")
+    aioresponses_mock.get(pattern, status=503)
+    aioresponses_mock.get(pattern, payload={"ok": True})
+    auth = AsyncAuth("test", token=json.loads(load_fixture("ring_oauth.json")))
+    auth.retries = 1
+
+    resp = await auth.query(url)
+    assert await resp.json() == {"ok": True}
+
+    # writes are not retried
+    aioresponses_mock.post(pattern, status=503)
+    aioresponses_mock.post(pattern, status=200)
+    with pytest.raises(aiohttp.ClientResponseError):
+        await auth.query(url, method="POST")
+    await auth.close()
@@ -154,3 +154,52 @@ async def test_motion_detection(ring, requests_mock):
         expected = "Front (hp_cam_v1) motion detection set to on"
         assert res.exit_code == 0
         assert expected in res.output
+
+
+async def test_videos_parallel_download(ring, requests_mock):
+    # make the doorbell a video capable model
+    ring.devices_data["doorbots"][987652]["kind"] = "doorbell_v5"
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        args = ["--download-all", "--workers", "4", "-dn", "Front Door", "-dn", "Front"]
+        res = await runner.invoke(videos, args, obj=ring)
+        assert res.exit_code == 0
+        assert "Downloading 4 videos" in res.output
+        assert "Downloaded 4 videos" in res.output
+        assert len(list(Path(".").glob("*.mp4"))) == 4
+
+        recordings = [r for r in requests_mock.request_history if "recording" in r.path]
+        res = await runner.invoke(videos, args, obj=ring)
+        assert res.exit_code == 0
+        assert "4 skipped" in res.output
+        assert len(
+            [r for r in requests_mock.request_history if "recording" in r.path]
+        ) == len(recordings)
+
+
+async def test_videos_download_failures_counted(ring, requests_mock):
+    ring.devices_data["doorbots"][987652]["kind"] = "doorbell_v5"
+    requests_mock.get(
+        "https://api.ring.com/clients_api/dings/987654321/recording", status_code=204
+    )
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        args = ["--download-all", "-dn", "Front"]
+        res = await runner.invoke(videos, args, obj=ring)
+        assert res.exit_code == 0
+        assert "Downloaded 1 videos" in res.output
+        assert "1 failed" in res.output
+
+
+async def test_videos_count_with_index(ring):
+    runner = CliRunner()
+
+    with runner.isolated_filesystem():
+        args = ["--count", "--index", "events.db", "-dn", "Front"]
+        res = await runner.invoke(videos, args, obj=ring)
+        assert res.exit_code == 0
+        assert "Total videos: 2" in res.output
+        assert "Motion triggered: 2" in res.output
+        assert Path("events.db").is_file()
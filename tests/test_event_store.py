@@ -0,0 +1,44 @@
+"""The tests for the Ring local event index."""
+from datetime import datetime, timezone
+
+from ring_doorbell import RingEventStore
+
+HISTORY_URL = "https://api.ring.com/clients_api/doorbots/987652/history"
+
+
+def _history_requests(requests_mock):
+    return [r for r in requests_mock.request_history if r.url.startswith(HISTORY_URL)]
+
+
+def test_event_store_sync(ring, requests_mock, tmp_path):
+    dev = ring.devices()["doorbots"][0]
+    path = str(tmp_path / "events.db")
+
+    with RingEventStore(path) as store:
+        assert store.sync(dev) == 2
+        assert len(_history_requests(requests_mock)) == 1
+
+    # reopening keeps the index and only the newest page is fetched
+    with RingEventStore(path) as store:
+        assert store.sync(dev) == 0
+        assert len(_history_requests(requests_mock)) == 2
+
+        assert store.count(dev) == 2
+        assert store.count(dev, kind="ding") == 0
+        assert store.count_by_kind(dev) == {"motion": 2}
+
+        since = datetime(2017, 3, 5, 16, tzinfo=timezone.utc)
+        assert [e["id"] for e in store.events(dev, since=since)] == [9876543212]
+        assert [e["id"] for e in store.events(dev, until=since)] == [987654321]
+        assert [e["id"] for e in store.events(dev, kind="motion", limit=1)] == [
+            9876543212
+        ]
+
+
+async def test_event_store_async_sync(async_ring, tmp_path):
+    dev = async_ring.devices()["doorbots"][0]
+
+    with RingEventStore(str(tmp_path / "events.db")) as store:
+        assert await store.async_sync(dev) == 2
+        assert await store.async_sync(dev) == 0
+        assert store.count(dev, kind="motion") == 2
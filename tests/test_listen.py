@@ -0,0 +1,106 @@
+"""The tests for the Ring push event listener."""
+import asyncio
+import json
+import socket
+import socketserver
+import threading
+
+import pytest
+
+from ring_doorbell import JsonLinesTransport, RingEventListener
+
+DINGS = [
+    {"id": 1, "kind": "ding", "doorbot_id": 987652},
+    {"id": 1, "kind": "ding", "doorbot_id": 987652},
+    {"id": 2, "kind": "motion", "doorbot_id": 987652},
+]
+
+
+class _Handler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for ding in DINGS:
+            self.wfile.write(json.dumps(ding).encode() + b"\n")
+        # keep the connection open until the listener disconnects
+        self.rfile.read()
+
+
+@pytest.fixture(name="server")
+def server_fixture():
+    server = socketserver.ThreadingTCPServer(("127.0.0.1", 0), _Handler)
+    server.daemon_threads = True
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _closed_port():
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        return sock.getsockname()[1]
+
+
+def _collect(listener, count):
+    received = []
+    done = threading.Event()
+
+    def _callback(event):
+        received.append(event)
+        if len(received) >= count:
+            done.set()
+
+    listener.add_callback(_callback)
+    return received, done
+
+
+def test_listener_push(ring, server):
+    transport = JsonLinesTransport(*server.server_address)
+    listener = RingEventListener(ring, transport, fallback_interval=None)
+    received, done = _collect(listener, 2)
+
+    listener.start()
+    assert done.wait(5)
+    listener.stop()
+
+    assert [event["id"] for event in received] == [1, 2]
+
+
+def test_listener_polling_fallback(ring, requests_mock):
+    transport = JsonLinesTransport("127.0.0.1", _closed_port())
+    listener = RingEventListener(
+        ring, transport, min_backoff=0.2, fallback_interval=0.05
+    )
+    received, done = _collect(listener, 3)
+
+    listener.start()
+    assert done.wait(5)
+    listener.stop()
+
+    # every active ding is dispatched once however often it is polled
+    assert len(received) == 3
+    assert len({event["id"] for event in received}) == 3
+
+
+async def test_async_listener_push(async_ring):
+    async def _handle(reader, writer):
+        for ding in DINGS:
+            writer.write(json.dumps(ding).encode() + b"\n")
+        await writer.drain()
+        await reader.read()
+
+    server = await asyncio.start_server(_handle, "127.0.0.1", 0)
+    transport = JsonLinesTransport(*server.sockets[0].getsockname()[:2])
+    listener = RingEventListener(async_ring, transport, fallback_interval=None)
+    received = []
+    listener.add_callback(received.append)
+
+    await listener.async_start()
+    for _ in range(100):
+        if len(received) == 2:
+            break
+        await asyncio.sleep(0.01)
+    await listener.async_stop()
+    server.close()
+
+    assert [event["id"] for event in received] == [1, 2]
@@ -0,0 +1,83 @@
+"""The tests for the Ring background poller."""
+import pytest
+
+from ring_doorbell import RingPoller
+
+DINGS_URL = "https://api.ring.com/clients_api/dings/active"
+
+
+def _force_due(poller):
+    for task in poller._tasks.values():
+        task.next_run = 0
+
+
+def test_poller_intervals(ring, requests_mock):
+    poller = RingPoller(ring)
+    requests_mock.reset_mock()
+
+    delay = poller.run_pending()
+    paths = {request.path for request in requests_mock.request_history}
+    assert "/clients_api/ring_devices" in paths
+    assert "/clients_api/dings/active" in paths
+    assert "/groups/v1/locations/mock-location-id/groups" in paths
+    assert "/clients_api/doorbots/987652/health" in paths
+    assert "/clients_api/chimes/999999/health" in paths
+
+    # dings are active so every data class is polled fast
+    assert poller.interval("dings") == 2
+    assert poller.interval("devices") == 15
+    assert 0 < delay <= 2
+
+    # once idle the intervals grow back to their configured value
+    requests_mock.get(DINGS_URL, json=[])
+    poller._active_until = 0
+    for expected in (4, 8, 10, 10):
+        _force_due(poller)
+        poller.run_pending()
+        assert poller.interval("dings") == expected
+
+    # errors back off up to max_interval
+    requests_mock.get(DINGS_URL, status_code=500)
+    for expected in (20, 40, 40):
+        _force_due(poller)
+        poller.run_pending()
+        assert poller.interval("dings") == expected
+        poller.max_interval = 40
+
+
+def test_poller_thread(ring, requests_mock):
+    poller = RingPoller(ring, intervals={"groups": None, "health": None})
+    assert "groups" not in poller._tasks
+    requests_mock.reset_mock()
+
+    poller.start()
+    poller.stop()
+    assert requests_mock.call_count >= 2
+
+
+def test_poller_unknown_data_class(ring):
+    with pytest.raises(ValueError):
+        RingPoller(ring, intervals={"history": 10})
+
+
+async def test_async_poller(async_ring, aioresponses_mock):
+    poller = RingPoller(async_ring, intervals={"health": None})
+
+    await poller.async_run_pending()
+    assert poller.interval("dings") == 2
+
+    await poller.async_start()
+    await poller.async_stop()
+
+
+def test_poller_expires_alerts(ring, requests_mock, mocker):
+    poller = RingPoller(ring, intervals={"groups": None, "health": None})
+    expire = mocker.patch.object(ring, "expire_alerts")
+    requests_mock.get(DINGS_URL, status_code=500)
+
+    poller.run_pending()
+    assert expire.call_count == 1
+
+    # not due again yet
+    poller.run_pending()
+    assert expire.call_count == 1
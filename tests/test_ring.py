@@ -1,10 +1,34 @@
 """The tests for the Ring platform."""
+import io
+import json
+import re
+import socket
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
 import pytest
+import pytz
+import requests
 
 from tests.helpers import load_fixture
 import requests_mock
 
-from ring_doorbell import Ring, Auth
+from ring_doorbell import (
+    Ring,
+    Auth,
+    DeviceChange,
+    HistoryEvent,
+    ResponseCache,
+    create_adapter,
+)
+from ring_doorbell.doorbot import (
+    _history_pages,
+    get_timezone,
+    parse_history_datetime,
+)
+from ring_doorbell.ring import _DeviceIndex
 
 
 def test_basic_attributes(ring):
@@ -83,6 +107,25 @@ def test_shared_doorbell_attributes(ring):
     assert dev.existing_doorbell_type == "Digital"
 
 
+def test_shared_doorbell_floodlight_kind(ring):
+    """Test a doorbell only reports the capabilities it implements."""
+    ring.devices_data["authorized_doorbots"][987653]["kind"] = "hp_cam_v1"
+    ring._set_devices_data(
+        {
+            family: list(devices.values())
+            for family, devices in ring.devices_data.items()
+        }
+    )
+    dev = ring.get_device_by_id(987653)
+
+    assert dev.model == "Floodlight Cam"
+    assert dev.has_capability("light") is False
+    assert dev.has_capability("siren") is False
+    assert dev.has_capability("motion_detection") is True
+    assert dev not in ring.get_devices_by_capability("light")
+    assert dev not in ring.get_devices_by_capability("siren")
+
+
 def test_stickup_cam_attributes(ring):
     dev = ring.devices()["stickup_cams"][0]
     assert dev.kind == "hp_cam_v1"
@@ -110,6 +153,35 @@ def test_stickup_cam_controls(ring, requests_mock):
     assert history[3].qs["duration"][0] == "30"
 
 
+def test_setters_write_through(ring, requests_mock):
+    """Test setters update the local state without refreshing all devices."""
+    dev = ring.devices()["stickup_cams"][0]
+    doorbell = ring.devices()["doorbots"][0]
+    chime = ring.devices()["chimes"][0]
+    requests_mock.put(
+        re.compile(r"https:\/\/api\.ring\.com\/clients_api\/(doorbots|chimes)\/\d+\?"),
+        text="ok",
+    )
+    requests_mock.reset_mock()
+
+    dev.lights = "off"
+    dev.siren = 30
+    doorbell.volume = 7
+    doorbell.motion_detection = False
+    chime.volume = 5
+
+    assert dev.lights == "off"
+    assert dev.siren == 30
+    assert doorbell.volume == 7
+    assert doorbell.motion_detection is False
+    assert chime.volume == 5
+    assert requests_mock.call_count == 5
+    assert all(
+        request.path != "/clients_api/ring_devices"
+        for request in requests_mock.request_history
+    )
+
+
 def test_light_groups(ring):
     group = ring.groups()["mock-group-id"]
 
@@ -147,3 +219,598 @@ def test_motion_detection_enable(ring, requests_mock):
     assert history[0].text == '{"motion_settings": {"motion_detection_enabled": true}}'
     assert history[1].path == "/devices/v1/devices/987652/settings"
     assert history[1].text == '{"motion_settings": {"motion_detection_enabled": false}}'
+
+
+def test_update_groups_concurrently(ring, requests_mock):
+    devices = json.loads(load_fixture("ring_devices.json"))
+    devices["chimes"][0]["location_id"] = "other-location-id"
+    requests_mock.get("https://api.ring.com/clients_api/ring_devices", json=devices)
+    ring.update_devices()
+    requests_mock.get(
+        "https://api.ring.com/groups/v1/locations/other-location-id/groups",
+        json={
+            "device_groups": [
+                {
+                    "device_group_id": "other-group-id",
+                    "location_id": "other-location-id",
+                    "name": "Porch",
+                }
+            ]
+        },
+    )
+
+    ring.update_groups()
+    concurrent = ring.groups_data
+    assert set(concurrent) == {"mock-group-id", "other-group-id"}
+
+    ring.max_workers = 1
+    ring.update_groups()
+    assert ring.groups_data == concurrent
+
+
+def test_conditional_polling(ring, requests_mock):
+    """Test unchanged polled endpoints are revalidated and not re-parsed."""
+    url = "https://api.ring.com/clients_api/ring_devices"
+    requests_mock.get(
+        url,
+        [
+            {
+                "text": load_fixture("ring_devices.json"),
+                "headers": {"ETag": '"v1"', "Last-Modified": "Mon, 05 Oct 2026"},
+            },
+            {"status_code": 304},
+            {"text": load_fixture("ring_devices.json"), "headers": {"ETag": '"v1"'}},
+        ],
+    )
+    ring.update_devices()
+    devices_data = ring.devices_data
+    device = ring.get_device_by_name("Front Door")
+
+    ring.update_devices()
+    request = requests_mock.last_request
+    assert request.headers["If-None-Match"] == '"v1"'
+    assert request.headers["If-Modified-Since"] == "Mon, 05 Oct 2026"
+    assert ring.devices_data is devices_data
+    assert ring.get_device_by_name("Front Door") is device
+
+    # a local change is reconciled with the server even if it is unchanged
+    cam = ring.devices()["stickup_cams"][0]
+    cam.lights = "on"
+    assert cam.lights == "on"
+    ring.update_devices()
+    assert "If-None-Match" not in requests_mock.last_request.headers
+    assert cam.lights == "off"
+
+
+def test_groups_follow_locations(ring, requests_mock):
+    """Test groups of locations without devices are dropped."""
+    assert ring.groups_data
+    for devices in ring.devices_data.values():
+        for attrs in devices.values():
+            attrs.pop("location_id", None)
+    ring._set_devices_data(
+        {
+            family: list(devices.values())
+            for family, devices in ring.devices_data.items()
+        }
+    )
+
+    ring.update_groups()
+    assert ring.groups_data == {}
+
+
+def test_recording_download_streams(ring, tmp_path):
+    dev = ring.devices()["doorbots"][0]
+
+    assert b"".join(dev.recording_stream(987654321, chunk_size=4)) == b"123456"
+
+    fileobj = io.BytesIO()
+    assert dev.recording_download(987654321, filename=fileobj, chunk_size=4) is True
+    assert fileobj.getvalue() == b"123456"
+
+    path = tmp_path / "recording.mp4"
+    assert dev.recording_download(987654321, filename=str(path)) is True
+    assert path.read_bytes() == b"123456"
+    assert dev.recording_download(987654321, filename=str(path)) is False
+
+
+def test_recording_download_resumes(ring, requests_mock, tmp_path, mocker):
+    dev = ring.devices()["doorbots"][0]
+    path = tmp_path / "recording.mp4"
+    part = tmp_path / "recording.mp4.part"
+    part.write_bytes(b"123")
+
+    requests_mock.get(
+        "https://api.ring.com/clients_api/dings/987654321/recording",
+        status_code=206,
+        content=b"456",
+        headers={"Content-Range": "bytes 3-5/6"},
+    )
+    assert dev.recording_download(987654321, filename=str(path)) is True
+    assert requests_mock.last_request.headers["Range"] == "bytes=3-"
+    assert path.read_bytes() == b"123456"
+    assert not part.exists()
+
+    # server ignoring the range restarts the download
+    part.write_bytes(b"xyz")
+    requests_mock.get(
+        "https://api.ring.com/clients_api/dings/987654321/recording",
+        status_code=200,
+        content=b"123456",
+    )
+    assert dev.recording_download(987654321, filename=str(path), override=True)
+    assert path.read_bytes() == b"123456"
+    assert not part.exists()
+
+    # a complete .part file is refused with 416 and downloaded again
+    part.write_bytes(b"123456")
+    close = mocker.spy(requests.Response, "close")
+    requests_mock.get(
+        "https://api.ring.com/clients_api/dings/987654321/recording",
+        [{"status_code": 416}, {"status_code": 200, "content": b"123456"}],
+    )
+    assert dev.recording_download(987654321, filename=str(path), override=True)
+    assert requests_mock.request_history[-2].headers["Range"] == "bytes=6-"
+    assert "Range" not in requests_mock.last_request.headers
+    assert [call.args[0].status_code for call in close.call_args_list] == [416, 200]
+    assert path.read_bytes() == b"123456"
+    assert not part.exists()
+
+
+def test_iter_history(ring, requests_mock):
+    dev = ring.devices()["doorbots"][0]
+
+    def _history_requests():
+        return [r for r in requests_mock.request_history if r.path.endswith("/history")]
+
+    events = dev.iter_history(page_size=2, convert_timezone=False)
+    assert next(events)["id"] == 987654321
+    assert next(events)["id"] == 9876543212
+    assert len(_history_requests()) == 1
+
+    # the next page only repeats known events which ends the iteration
+    assert list(events) == []
+    assert _history_requests()[-1].qs["older_than"] == ["9876543212"]
+    assert len(_history_requests()) == 2
+
+    # enforce_limit walks the cursor in full pages instead of doubling the limit
+    dev.history(limit=1, kind="ding", enforce_limit=True, retry=5)
+    assert [r.qs["limit"] for r in _history_requests()[2:]] == [["100"]]
+
+    # as deep as the doubled queries went: 30 * 2 ** 7 events
+    assert _history_pages(30, True, 8) == (100, 39)
+    assert _history_pages(30, False, 8) == (30, 1)
+
+
+def test_history_timezone_conversion(ring):
+    dev = ring.devices()["doorbots"][0]
+
+    utc_event = dev.history(limit=1)[0]
+    assert utc_event["created_at"] == datetime(2017, 3, 5, 15, 3, 40, tzinfo=pytz.utc)
+
+    event = dev.history(limit=1, timezone="America/New_York")[0]
+    assert event["created_at"] == utc_event["created_at"]
+    assert event["created_at"].tzinfo.zone == "America/New_York"
+    assert event["created_at"].hour == 10
+
+    raw = dev.history(limit=1, convert_timezone=False)[0]["created_at"]
+    assert parse_history_datetime(raw, "America/New_York") == event["created_at"]
+    assert get_timezone("America/New_York") is get_timezone("America/New_York")
+
+
+def test_history_as_events(ring):
+    dev = ring.devices()["doorbots"][0]
+
+    events = dev.history(limit=2, timezone="America/New_York", as_events=True)
+    assert [event.id for event in events] == [987654321, 9876543212]
+
+    event = events[0]
+    assert isinstance(event, HistoryEvent)
+    assert not hasattr(event, "__dict__")
+    assert event.kind == "motion"
+    assert event.kind is events[1].kind
+    assert event.answered is False
+    assert event.device_id == 987652
+    assert event.created_at.hour == 10
+    assert event.created_at.tzinfo.zone == "America/New_York"
+    assert event.to_dict() == {
+        "id": 987654321,
+        "kind": "motion",
+        "created_at": "2017-03-05T15:03:40.000Z",
+        "answered": False,
+        "duration": None,
+        "doorbot": {"id": 987652},
+    }
+
+
+def test_device_objects_are_reused(ring, requests_mock):
+    chime = ring.devices()["chimes"][0]
+    chime.update_health_data()
+
+    assert ring.get_device_by_name("Downstairs") is chime
+    assert ring.get_device_list()[-1] is chime
+
+    ring.update_devices()
+    assert ring.devices()["chimes"][0] is chime
+    assert chime.wifi_name == "ring_mock_wifi"
+
+    # removed devices are dropped from the map
+    requests_mock.get(
+        "https://api.ring.com/clients_api/ring_devices",
+        json={"chimes": [], "doorbots": [], "authorized_doorbots": []},
+    )
+    ring.update_devices()
+    assert ring.devices()["chimes"] == []
+    assert not ring._devices
+
+
+def test_device_index(ring):
+    doorbell = ring.devices()["doorbots"][0]
+    chime = ring.devices()["chimes"][0]
+    stickup_cam = ring.devices()["stickup_cams"][0]
+
+    assert ring.get_device_by_name("Front Door") is doorbell
+    assert ring.get_device_by_name("Unknown") is None
+    assert ring.get_device_by_id(999999) is chime
+    assert ring.get_device_by_device_id("abcdef123") is chime
+    assert ring.get_devices_by_location("mock-location-id") == [stickup_cam]
+    assert ring.get_devices_by_capability("light") == [stickup_cam]
+    assert chime in ring.get_devices_by_capability("volume")
+    assert ring.get_devices_by_capability("unknown") == []
+
+    # devices without a device_id are not indexed under None
+    del ring.devices_data["doorbots"][doorbell.id]["device_id"]
+    ring._set_devices_data(
+        {
+            family: list(devices.values())
+            for family, devices in ring.devices_data.items()
+        }
+    )
+    assert ring.get_device_by_device_id(None) is None
+
+
+def test_device_kind_lookup(ring, caplog):
+    """Test models and capabilities come from the shared kind table."""
+    dev = ring.devices()["stickup_cams"][0]
+    dev._attrs["kind"] = "stickup_cam_v4"
+    assert dev.model == "Spotlight Cam Battery"
+    assert dev.has_capability("battery") is True
+    assert dev.has_capability("volume") is False
+    dev._attrs["ring_cam_setup_flow"] = "solar"
+    assert dev.model == "Spotlight Cam Solar"
+
+    dev._attrs["kind"] = "unknown_cam_v9"
+    assert dev.model is None
+    assert dev.has_capability("video") is False
+    assert dev.model is None
+    assert caplog.text.count("Unknown kind: unknown_cam_v9") == 1
+
+
+def test_settings_batch(ring, requests_mock):
+    """Test a batch merges the settings changes into the fewest requests."""
+    dev = ring.devices()["stickup_cams"][0]
+    requests_mock.put(
+        re.compile(r"https:\/\/api\.ring\.com\/clients_api\/doorbots\/\d+\?"),
+        text="ok",
+    )
+    requests_mock.reset_mock()
+
+    with dev.batch():
+        dev.volume = 3
+        dev.motion_detection = True
+        dev.lights = "on"
+        dev.existing_doorbell_type = 1
+        dev.motion_detection = False
+        dev.lights = "off"
+        assert requests_mock.call_count == 0
+
+    history = requests_mock.request_history
+    assert [(request.method, request.path) for request in history] == [
+        ("PUT", "/clients_api/doorbots/987652"),
+        ("PATCH", "/devices/v1/devices/987652/settings"),
+        ("PUT", "/clients_api/doorbots/987652/floodlight_light_off"),
+    ]
+    assert history[0].qs["doorbot[settings][doorbell_volume]"] == ["3"]
+    assert history[0].qs["doorbot[settings][chime_settings][type]"] == ["1"]
+    assert history[1].json() == {"motion_settings": {"motion_detection_enabled": False}}
+    assert dev.volume == 3
+    assert dev.motion_detection is False
+    assert dev.lights == "off"
+
+    requests_mock.reset_mock()
+    with pytest.raises(ValueError):
+        with dev.batch():
+            dev.lights = "on"
+            raise ValueError
+    assert requests_mock.call_count == 0
+    assert dev.lights == "off"
+
+
+def test_device_change_listener(ring, requests_mock):
+    """Test listeners receive per-field deltas of the device updates."""
+    received = []
+    ring.add_device_listener(received.append)
+
+    devices = json.loads(load_fixture("ring_devices.json"))
+    devices["stickup_cams"][0]["led_status"] = "on"
+    devices["doorbots"][0]["alerts"]["connection"] = "offline"
+    removed = devices["chimes"].pop()
+    requests_mock.get("https://api.ring.com/clients_api/ring_devices", json=devices)
+    ring.update_devices()
+
+    changes = {(change.family, change.action): change for change in received[0]}
+    assert len(received[0]) == 3
+    assert changes[("stickup_cams", "changed")].fields == {"led_status": ("off", "on")}
+    assert changes[("doorbots", "changed")].fields == {
+        "alerts.connection": ("online", "offline")
+    }
+    assert changes[("chimes", "removed")].id == removed["id"]
+
+    # unchanged data does not notify, setters do
+    ring.update_devices()
+    assert len(received) == 1
+    ring.devices()["stickup_cams"][0].lights = "off"
+    assert received[1] == [
+        DeviceChange("stickup_cams", 987652, "changed", {"led_status": ("on", "off")})
+    ]
+
+    ring.remove_device_listener(received.append)
+    ring.devices()["stickup_cams"][0].lights = "on"
+    assert len(received) == 2
+
+
+def test_active_alerts(ring, requests_mock, monkeypatch):
+    """Test alerts are routed to their device and dropped once expired."""
+    now = 1696401245.0
+    monkeypatch.setattr("ring_doorbell.ring.time", lambda: now)
+    dings = json.loads(load_fixture("ring_ding_active.json"))
+    for ding in dings:
+        ding["now"] = now
+    dings[2]["expires_in"] = 10
+    requests_mock.get("https://api.ring.com/clients_api/dings/active", json=dings)
+    expired = []
+    ring.add_alert_expired_listener(expired.append)
+
+    ring.update_dings()
+    dev = ring.get_device_by_id(987652)
+    assert [alert["id"] for alert in ring.active_alerts()] == [
+        ding["id"] for ding in dings
+    ]
+    assert dev.active_alert["id"] == dings[1]["id"]
+    assert dev.alert_expires_at == now + dings[1]["expires_in"]
+
+    now += 100
+    assert len(ring.active_alerts()) == 2
+    assert expired == [dings[2]]
+    assert dev.active_alert is not None
+
+    now += 1000
+    assert ring.active_alerts() == []
+    assert dev.active_alert is None
+    assert dev.alert_expires_at is None
+    assert len(expired) == 3
+
+
+def test_alerts_routed_during_devices_update(ring, requests_mock, monkeypatch):
+    """Test alerts indexed while the device index is swapped are routed."""
+    now = 1696401245.0
+    monkeypatch.setattr("ring_doorbell.ring.time", lambda: now)
+    dings = json.loads(load_fixture("ring_ding_active.json"))
+    for ding in dings:
+        ding["now"] = now
+    requests_mock.get("https://api.ring.com/clients_api/dings/active", json=dings)
+    devices = json.loads(load_fixture("ring_devices.json"))
+    # as on the first update_data, before any device is known
+    ring._index = _DeviceIndex()
+    replace = ring._alerts.replace
+
+    def _replace(alerts, lookup, now):
+        # the devices update of another thread completes in between
+        ring._set_devices_data(devices)
+        replace(alerts, lookup, now)
+
+    monkeypatch.setattr(ring._alerts, "replace", _replace)
+    ring.update_dings()
+    assert ring.get_device_by_id(987652).alert is not None
+
+
+def test_alerts_expire_on_update(ring, requests_mock, monkeypatch):
+    """Test expired alerts are reported when the next dings drop them."""
+    now = 1696401245.0
+    monkeypatch.setattr("ring_doorbell.ring.time", lambda: now)
+    dings = json.loads(load_fixture("ring_ding_active.json"))
+    for ding in dings:
+        ding["now"] = now
+    url = "https://api.ring.com/clients_api/dings/active"
+    requests_mock.get(url, json=dings)
+    expired = []
+    ring.add_alert_expired_listener(expired.append)
+    ring.update_dings()
+
+    now += 1000
+    requests_mock.get(url, json=[])
+    ring.update_dings()
+    assert expired == dings
+
+
+def test_update_health(ring, requests_mock):
+    """Test health data is fetched for stale devices only."""
+
+    def _health_requests():
+        return [
+            request
+            for request in requests_mock.request_history
+            if request.path.endswith("/health")
+        ]
+
+    devices = ring.get_device_list()
+    ring.update_health()
+    assert len(_health_requests()) == len(devices)
+    assert devices[0].wifi_name == "ring_mock_wifi"
+
+    ring.update_health(max_workers=1)
+    assert len(_health_requests()) == len(devices)
+
+    ring.update_health(devices[:1], force=True)
+    assert len(_health_requests()) == len(devices) + 1
+
+    ring.health_ttl = 0
+    ring.update_health()
+    assert len(_health_requests()) == 2 * len(devices) + 1
+
+
+def test_response_cache(ring, requests_mock):
+    """Test GET responses are cached until a write touches the device."""
+    ring.cache = ResponseCache()
+    chime = ring.devices()["chimes"][0]
+    linked_url = "https://api.ring.com/clients_api/chimes/999999/linked_doorbots"
+    requests_mock.get(linked_url, json={"doorbots": []})
+    requests_mock.put(
+        re.compile(r"https:\/\/api\.ring\.com\/clients_api\/chimes\/999999\?"),
+        text="ok",
+    )
+
+    assert chime.linked_tree == {"doorbots": []}
+    assert chime.linked_tree == {"doorbots": []}
+    chime.update_health_data()
+    chime.update_health_data()
+    assert len(ring.cache) == 2
+    linked_requests = [
+        r for r in requests_mock.request_history if r.url.startswith(linked_url)
+    ]
+    assert len(linked_requests) == 1
+
+    # a write to the chime drops its entries
+    chime.volume = 5
+    assert len(ring.cache) == 0
+    assert chime.linked_tree == {"doorbots": []}
+    linked_requests = [
+        r for r in requests_mock.request_history if r.url.startswith(linked_url)
+    ]
+    assert len(linked_requests) == 2
+
+
+def test_response_cache_limits():
+    """Test the cache evicts the least recently used entries."""
+    cache = ResponseCache({"/a/{0}": 60}, max_entries=2, max_bytes=10)
+    cache.set("/a/1", None, "one", 4)
+    cache.set("/a/2", None, "two", 4)
+    assert cache.get("/a/1") == "one"
+    cache.set("/a/3", None, "three", 4)
+    assert cache.get("/a/2") is None
+    assert cache.get("/a/1") == "one"
+    assert cache.get("/a/3") == "three"
+
+    cache.set("/a/4", None, "four", 8)
+    assert len(cache) == 1
+    cache.set("/b/1", None, "other", 1)
+    assert cache.get("/b/1") is None
+    cache.set("/a/5", None, "big", 11)
+    assert cache.get("/a/5") is None
+
+    cache.invalidate("/a/4/settings")
+    assert len(cache) == 0
+
+
+def test_concurrent_gets_are_coalesced(ring, requests_mock):
+    """Test identical GETs in flight at the same time share one request."""
+    calls = []
+
+    def _slow(request, context):
+        calls.append(request)
+        time.sleep(0.2)
+        return '{"doorbots": []}'
+
+    url = "/clients_api/chimes/999999/linked_doorbots"
+    requests_mock.get("https://api.ring.com" + url, text=_slow)
+
+    with ThreadPoolExecutor(max_workers=5) as executor:
+        responses = list(executor.map(lambda _: ring.query(url), range(5)))
+
+    assert len(calls) == 1
+    assert all(response is responses[0] for response in responses)
+
+    # writes are never shared
+    requests_mock.put("https://api.ring.com" + url, text=_slow)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        list(executor.map(lambda _: ring.query(url, method="PUT"), range(2)))
+    assert len(calls) == 3
+
+
+def test_concurrent_token_refresh(ring, requests_mock):
+    """Test callers hitting an expired token share a single refresh."""
+    updates = []
+    ring.auth.token_updater = updates.append
+    ring.auth._oauth._client._expires_at = 1
+    requests_mock.reset_mock()
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        list(
+            executor.map(
+                lambda path: ring.query(path),
+                [
+                    "/clients_api/ring_devices",
+                    "/clients_api/dings/active",
+                    "/clients_api/doorbots/987652/health",
+                    "/clients_api/chimes/999999/health",
+                ],
+            )
+        )
+
+    token_requests = [
+        request
+        for request in requests_mock.request_history
+        if request.hostname == "oauth.ring.com"
+    ]
+    assert len(token_requests) == 1
+    assert len(updates) == 1
+
+
+def test_proactive_token_refresh(requests_mock):
+    """Test the token is refreshed in the background before it expires."""
+    refreshed = threading.Event()
+    token = json.loads(load_fixture("ring_oauth.json"))
+    token["expires_at"] = time.time() + 60
+    auth = Auth(
+        "test",
+        token=token,
+        token_updater=lambda _: refreshed.set(),
+        auto_refresh=True,
+        refresh_margin=60,
+    )
+
+    assert refreshed.wait(5)
+    assert auth.expires_at > time.time() + 3000
+    assert auth._refresh_timer is not None
+    auth.close()
+    assert auth._refresh_timer is None
+
+
+def test_connection_pool(requests_mock):
+    """Test the connection pool can be sized and shared between accounts."""
+    auth = Auth("test")
+    assert auth._oauth.get_adapter("https://api.ring.com") is auth.adapter
+    assert auth.adapter._pool_maxsize == 16
+    assert auth.adapter.max_retries.total == 0
+
+    adapter = create_adapter(pool_maxsize=32, retries=3)
+    first = Auth("test", adapter=adapter)
+    second = Auth("test", adapter=adapter)
+    assert first._oauth.get_adapter("https://api.ring.com") is adapter
+    assert second._oauth.get_adapter("https://api.ring.com") is adapter
+    assert adapter._pool_maxsize == 32
+    assert adapter.max_retries.total == 3
+    assert 503 in adapter.max_retries.status_forcelist
+
+
+def test_connection_pool_read_timeout(requests_mock):
+    """Test a read timeout still raises ReadTimeout without retries."""
+    with socket.socket() as server:
+        server.bind(("127.0.0.1", 0))
+        server.listen()
+        session = requests.Session()
+        session.mount("http://", create_adapter())
+        url = "http://127.0.0.1:{}/".format(server.getsockname()[1])
+        requests_mock.get(url, real_http=True)
+        with pytest.raises(requests.ReadTimeout):
+            session.get(url, timeout=0.2)